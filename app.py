@@ -11,7 +11,18 @@ from werkzeug.exceptions import HTTPException, NotFound
 from flask_migrate import Migrate
 from sqlalchemy import text
 from comment.models import db  # Comment 모델 import
-from comment.routes import bp  # Comment 라우트 import
+from comment.routes import bp, enable_async_views  # Comment 라우트 import
+from comment.search import ensure_search_index
+from comment.ranking import ensure_score_column
+from comment.archive import ensure_archive_index
+from comment.counters import ensure_user_comments_index
+from comment.ingest import ensure_source_id_column
+from comment.schema import ensure_like_unique_index
+from comment.idempotency import ensure_lock_columns
+from comment.outbox import ensure_outbox_columns
+from comment.commands import comments_cli
+from comment.stream import init_stream
+from comment.async_db import init_async_db
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -33,7 +44,8 @@ def create_app(config_class=None):
     CORS(app,
      origins=["https://www.hhottdogg.shop", "https://hhottdogg.shop"],
      methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-     allow_headers=["Content-Type", "Authorization"],
+     allow_headers=["Content-Type", "Authorization", "Idempotency-Key", "Last-Event-ID"],
+     expose_headers=["Idempotent-Replayed"],
      supports_credentials=True,
      max_age=86400)
 
@@ -41,6 +53,12 @@ def create_app(config_class=None):
     db.init_app(app)
     Migrate(app, db)
 
+    # 실시간 댓글 스트림 허브 초기화
+    init_stream(app)
+
+    # async 조회 뷰용 비동기 DB 엔진 초기화 (ASYNC_VIEWS_ENABLED일 때만 생성)
+    init_async_db(app)
+
     # 데이터베이스 및 테이블 생성 - 연결 실패 시에도 애플리케이션은 계속 실행
     with app.app_context():
         try:
@@ -72,6 +90,29 @@ def create_app(config_class=None):
             # 테이블 생성
             db.create_all()
             logger.info("Database tables created successfully")
+            
+            # 기존 테이블에 best 정렬 점수 컬럼 추가
+            ensure_score_column()
+            
+            # 기존 테이블에 모델 인덱스 추가 (create_all은 기존 테이블을 변경하지 않음)
+            ensure_archive_index()
+            ensure_user_comments_index()
+            
+            # 대량 적재 중복 방지용 source_id 컬럼 추가
+            ensure_source_id_column()
+            
+            # 좋아요 중복 방지 유니크 인덱스 (기존 중복 정리 후 생성)
+            ensure_like_unique_index()
+            
+            # Idempotency-Key 처리 임대 컬럼 추가
+            ensure_lock_columns()
+            
+            # 아웃박스 재시도/dead letter 컬럼 추가
+            ensure_outbox_columns()
+            
+            # 전문 검색 인덱스 생성
+            search_backend = ensure_search_index()
+            logger.info(f"Comment search backend: {search_backend}")
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
             logger.warning("Application will continue without database initialization")
@@ -80,6 +121,12 @@ def create_app(config_class=None):
 
     # 블루프린트 등록
     app.register_blueprint(bp, url_prefix='/api/v1')
+    # ASYNC_VIEWS_ENABLED일 때만 조회 뷰를 async 버전으로 교체 (기본은 동기 뷰)
+    if app.config.get('ASYNC_VIEWS_ENABLED'):
+        enable_async_views(app)
+
+    # 배치 작업 CLI 등록 (flask comments ...)
+    app.cli.add_command(comments_cli)
 
 
     # 전역 에러 핸들러
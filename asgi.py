@@ -0,0 +1,66 @@
+"""
+Comment Service ASGI 엔트리포인트
+uvicorn 등 ASGI 서버의 이벤트 루프 하나를 프로세스 수명 동안 사용해 async 조회 뷰를 실행합니다.
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8083
+
+- Flask 앱(WSGI)은 스레드 풀(ASGI_THREADS)에서 실행하고, async 뷰의 코루틴은 서버 이벤트 루프에서 실행합니다.
+  그래서 비동기 엔진의 커넥션 풀(ASYNC_DB_POOL_SIZE)을 요청 간에 재사용할 수 있습니다.
+- asgiref 기본 WsgiToAsgi는 모든 요청을 스레드 하나에서 차례로 실행하므로 스레드 풀 버전을 사용합니다.
+- 서버 종료(lifespan shutdown) 시 비동기 엔진의 커넥션 풀을 닫습니다.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+# ASGI 서버에서는 async 뷰와 풀링된 비동기 엔진을 기본으로 사용 (환경변수로 덮어쓸 수 있음)
+os.environ.setdefault('ASYNC_VIEWS_ENABLED', 'true')
+os.environ.setdefault('ASYNC_DB_POOL_SIZE', '10')
+
+from app import app as flask_app  # noqa: E402
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get('ASGI_THREADS', '32')),
+    thread_name_prefix='comment-asgi'
+)
+
+
+class ThreadPoolWsgiToAsgiInstance(WsgiToAsgiInstance):
+    """WSGI 앱을 공유 스레드 하나 대신 스레드 풀에서 실행하는 요청 인스턴스"""
+
+    run_wsgi_app = sync_to_async(
+        WsgiToAsgiInstance.__dict__['run_wsgi_app'].func,
+        thread_sensitive=False,
+        executor=_executor
+    )
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    """요청마다 ThreadPoolWsgiToAsgiInstance를 만드는 ASGI 어댑터"""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+            return
+        await ThreadPoolWsgiToAsgiInstance(self.wsgi_application, self.duplicate_header_limit)(
+            scope, receive, send
+        )
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                engine = self.wsgi_application.extensions.get("comment_async_db")
+                if engine is not None:
+                    await engine.dispose()
+                _executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+app = ThreadPoolWsgiToAsgi(flask_app)
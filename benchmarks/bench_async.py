@@ -0,0 +1,112 @@
+"""
+동기/비동기 조회 경로 동시성 벤치마크
+같은 게시글 댓글 목록 조회를 동시에 C개씩 실행할 때
+- threaded: 스레드 C개가 각각 CommentService.get_comments 실행 (스레드 모드 워커와 같은 방식)
+- asyncio : 이벤트 루프 하나에서 AsyncCommentService.get_comments C개를 동시에 실행
+의 초당 처리량과 평균 지연, 사용한 스레드 수를 비교합니다.
+
+SQLite(aiosqlite)는 연결마다 내부 스레드를 쓰고 네트워크 대기가 없으므로 비동기 이점이 거의 없습니다.
+이점은 DB 왕복 지연이 큰 MySQL(aiomysql) 환경에서 나타납니다.
+
+사용법: python benchmarks/bench_async.py [동시성 목록(쉼표 구분)] [동시성당 요청 수]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from config import TestingConfig  # noqa: E402
+from comment.async_services import AsyncCommentService  # noqa: E402
+from comment.ingest import ingest_comments  # noqa: E402
+from comment.models import db  # noqa: E402
+from comment.services import CommentService  # noqa: E402
+
+POSTS = 100
+
+
+def generate_records(count: int):
+    for i in range(count):
+        yield i + 1, {
+            "post_id": f"post-{i % POSTS}",
+            "user_id": f"user-{i % 1000}",
+            "user_name": f"user{i % 1000}",
+            "content": f"comment body number {i}",
+        }
+
+
+def run_threaded(app, concurrency: int, requests: int) -> dict:
+    latencies = []
+    peak_threads = [threading.active_count()]
+
+    def one(i):
+        with app.app_context():
+            started = time.perf_counter()
+            CommentService.get_comments(f"post-{i % POSTS}", limit=20)
+            latencies.append(time.perf_counter() - started)
+            peak_threads[0] = max(peak_threads[0], threading.active_count())
+            db.session.remove()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(requests)))
+    elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "latencies": latencies, "threads": peak_threads[0]}
+
+
+def run_async(app, concurrency: int, requests: int) -> dict:
+    latencies = []
+    peak_threads = [threading.active_count()]
+
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i):
+            async with semaphore:
+                started = time.perf_counter()
+                await AsyncCommentService.get_comments(f"post-{i % POSTS}", limit=20)
+                latencies.append(time.perf_counter() - started)
+                peak_threads[0] = max(peak_threads[0], threading.active_count())
+
+        await asyncio.gather(*(one(i) for i in range(requests)))
+
+    with app.app_context():
+        started = time.perf_counter()
+        asyncio.run(main())
+        elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "latencies": latencies, "threads": peak_threads[0]}
+
+
+def report(label: str, concurrency: int, requests: int, result: dict) -> None:
+    latency_ms = sum(result["latencies"]) / len(result["latencies"]) * 1000
+    print(f"{label:<8} c={concurrency:<4}: {requests / result['elapsed']:8.0f} req/s, "
+          f"avg latency {latency_ms:7.2f} ms, peak threads {result['threads']}")
+
+
+def main():
+    levels = [int(c) for c in (sys.argv[1] if len(sys.argv) > 1 else "1,8,32,128").split(",")]
+    per_level = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            ASYNC_VIEWS_ENABLED = True
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            ingest_comments(generate_records(20000))
+
+        for concurrency in levels:
+            requests = concurrency * per_level
+            report("threaded", concurrency, requests, run_threaded(app, concurrency, requests))
+            report("asyncio", concurrency, requests, run_async(app, concurrency, requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+댓글 목록 조회 경로 벤치마크
+100개 댓글 페이지 하나를 ORM Comment 객체로 조회하는 경로와 Core 행으로 만든 CommentRecord 경로의
+페이지당 CPU 시간과 결과 목록이 차지하는 메모리를 비교합니다.
+
+사용법: python benchmarks/bench_dto.py [반복 횟수] [페이지 크기]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from config import TestingConfig  # noqa: E402
+from comment.ingest import ingest_comments  # noqa: E402
+from comment.models import db, Comment  # noqa: E402
+from comment.services import CommentService  # noqa: E402
+
+
+def generate_records(count: int):
+    for i in range(count):
+        yield i + 1, {
+            "post_id": "post-bench",
+            "user_id": f"user-{i % 100}",
+            "user_name": f"user{i % 100}",
+            "content": f"comment body number {i} with a typical amount of text in it",
+        }
+
+
+def orm_page(limit: int):
+    """기존 경로 - ORM 쿼리로 Comment 객체 목록 조회"""
+    query = Comment.query.filter_by(post_id="post-bench", status="visible")
+    total = query.count()
+    return query.order_by(Comment.created_at.desc()).limit(limit).all(), total
+
+
+def record_page(limit: int):
+    return CommentService.get_comments("post-bench", limit=limit)
+
+
+def measure(label: str, fetch, iterations: int, limit: int) -> None:
+    # CPU 시간: 요청마다 조회 + 직렬화 후 세션 정리 (Flask 요청 종료와 동일)
+    started = time.process_time()
+    for _ in range(iterations):
+        comments, _ = fetch(limit)
+        [comment.to_dict() for comment in comments]
+        db.session.remove()
+    cpu_ms = (time.process_time() - started) * 1000 / iterations
+
+    # 메모리: 한 페이지 결과를 들고 있는 동안 할당된 크기 (세션 identity map 포함)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    comments, _ = fetch(limit)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    page_kb = sum(stat.size_diff for stat in after.compare_to(before, "filename")) / 1024
+    del comments
+    db.session.remove()
+
+    print(f"{label:<14}: {cpu_ms:.3f} ms CPU/page, {page_kb:.1f} KB retained/page ({limit} comments)")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            ingest_comments(generate_records(10000))
+
+            for label, fetch in (("ORM Comment", orm_page), ("CommentRecord", record_page)):
+                fetch(limit)  # 문장 컴파일 캐시 준비
+                db.session.remove()
+                measure(label, fetch, iterations, limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+댓글 스트리밍 내보내기 벤치마크
+한 게시글에 대량 적재한 댓글을 iter_export로 NDJSON/CSV(gzip 선택) 바이트 스트림으로 변환하며
+초당 처리 행 수와 프로세스 최대 RSS 변화를 측정합니다 (메모리가 행 수와 무관하게 일정해야 함).
+
+사용법: python benchmarks/bench_export.py [행 수] [청크 크기]
+"""
+
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from config import TestingConfig  # noqa: E402
+from comment.export import iter_comment_rows, iter_export  # noqa: E402
+from comment.ingest import ingest_comments  # noqa: E402
+
+
+def generate_records(count: int):
+    """한 게시글에 몰린 (줄 번호, 객체) 스트림을 지연 생성"""
+    for i in range(count):
+        yield i + 1, {
+            "post_id": "post-export",
+            "user_id": f"user-{i % 5000}",
+            "user_name": f"user{i % 5000}",
+            "content": f"exported comment body number {i}, with \"quotes\" and commas",
+        }
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_export(rows: int, fmt: str, gzip: bool, chunk_size: int) -> None:
+    rss_before = peak_rss_mb()
+    started = time.monotonic()
+    total_bytes = 0
+    for chunk in iter_export(iter_comment_rows(post_id="post-export", chunk_size=chunk_size), fmt=fmt, gzip=gzip):
+        total_bytes += len(chunk)
+    elapsed = time.monotonic() - started
+
+    label = fmt + (".gz" if gzip else "")
+    print(f"{label:<10}: {rows} rows in {elapsed:.3f}s -> {rows / elapsed:.0f} rows/s, "
+          f"{total_bytes / 1024 / 1024:.1f} MB output, peak RSS {peak_rss_mb():.1f} MB "
+          f"(+{peak_rss_mb() - rss_before:.1f} MB)")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            stats = ingest_comments(generate_records(rows), chunk_size=5000)
+            print(f"fixture    : {stats['inserted']} rows in {stats['elapsed_seconds']}s, peak RSS {peak_rss_mb():.1f} MB")
+
+            for fmt, gzip in (("ndjson", False), ("csv", False), ("ndjson", True)):
+                run_export(stats["inserted"], fmt, gzip, chunk_size)
+
+
+if __name__ == "__main__":
+    main()
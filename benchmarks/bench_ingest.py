@@ -0,0 +1,56 @@
+"""
+댓글 대량 적재 벤치마크
+청크 단위 multi-row INSERT 경로와 CommentService.create_comment(행당 add/commit/refresh) 경로의
+초당 처리 행 수를 비교합니다.
+
+사용법: python benchmarks/bench_ingest.py [행 수] [청크 크기]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from config import TestingConfig  # noqa: E402
+from comment.ingest import ingest_comments  # noqa: E402
+from comment.services import CommentService  # noqa: E402
+
+
+def generate_records(count: int):
+    """NDJSON을 파싱한 것과 같은 (줄 번호, 객체) 스트림을 지연 생성"""
+    for i in range(count):
+        yield i + 1, {
+            "post_id": f"post-{i % 500}",
+            "user_id": f"user-{i % 5000}",
+            "user_name": f"user{i % 5000}",
+            "content": f"legacy comment body number {i} with some searchable words",
+        }
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            stats = ingest_comments(generate_records(rows), chunk_size=chunk_size)
+            print(f"bulk ingest : {stats['inserted']} rows in {stats['elapsed_seconds']}s "
+                  f"-> {stats['rows_per_second']} rows/s (chunk={chunk_size})")
+
+            single_rows = min(rows, 2000)
+            started = time.monotonic()
+            for _, raw in generate_records(single_rows):
+                CommentService.create_comment(raw["post_id"], raw["user_id"], raw["user_name"], raw["content"])
+            elapsed = time.monotonic() - started
+            print(f"per-row path: {single_rows} rows in {elapsed:.3f}s -> {single_rows / elapsed:.1f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
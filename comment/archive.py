@@ -0,0 +1,150 @@
+"""
+Comment Service 아카이브/정리 작업
+삭제/숨김 상태로 보존 기간이 지난 댓글과 좋아요를 아카이브 테이블로 옮겨
+comments 테이블(핫 테이블)을 작게 유지합니다.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, insert, select
+
+from .models import db, Comment, CommentLike, CommentArchive, CommentLikeArchive
+from . import search
+from .schema import ensure_index
+
+logger = logging.getLogger(__name__)
+
+ARCHIVABLE_STATUSES = ("deleted", "hidden")
+
+_COMMENT_COLUMNS = ["id", "post_id", "user_id", "user_name", "content",
+                    "status", "like_count", "created_at", "updated_at", "source_id"]
+_LIKE_COLUMNS = ["id", "comment_id", "user_id", "created_at"]
+STATUS_UPDATED_INDEX = "ix_comments_status_updated_at"
+
+
+def ensure_archive_index() -> bool:
+    """기존 comments 테이블에 아카이브 대상 스캔용 (status, updated_at) 인덱스 추가"""
+    return ensure_index(Comment.__table__, STATUS_UPDATED_INDEX)
+
+
+def _archive_batch(comment_ids: list, cutoff: datetime) -> Tuple[int, int]:
+    """댓글 한 묶음과 좋아요를 아카이브로 이동 (하나의 트랜잭션) - (댓글 수, 좋아요 수) 반환"""
+    comments = Comment.__table__
+    likes = CommentLike.__table__
+
+    # 조회 이후 복구(visible)되거나 다시 수정된 댓글은 제외하고, 남은 행은 커밋까지 잠금
+    archivable = (
+        comments.c.id.in_(comment_ids),
+        comments.c.status.in_(ARCHIVABLE_STATUSES),
+        comments.c.updated_at < cutoff,
+    )
+    comment_ids = db.session.execute(
+        select(comments.c.id).where(*archivable).with_for_update()
+    ).scalars().all()
+    if not comment_ids:
+        db.session.commit()
+        return 0, 0
+    archivable = (comments.c.id.in_(comment_ids),) + archivable[1:]
+
+    db.session.execute(
+        insert(CommentArchive.__table__).from_select(
+            _COMMENT_COLUMNS,
+            select(*[comments.c[name] for name in _COMMENT_COLUMNS]).where(*archivable)
+        )
+    )
+    like_result = db.session.execute(
+        insert(CommentLikeArchive.__table__).from_select(
+            _LIKE_COLUMNS,
+            select(*[likes.c[name] for name in _LIKE_COLUMNS]).where(likes.c.comment_id.in_(comment_ids))
+        )
+    )
+    db.session.execute(delete(likes).where(likes.c.comment_id.in_(comment_ids)))
+    db.session.execute(delete(comments).where(*archivable))
+    search.remove_comments(comment_ids)
+    db.session.commit()
+    return len(comment_ids), like_result.rowcount or 0
+
+
+def archive_comments(retention_days: int = 30, batch_size: int = 500,
+                     sleep_seconds: float = 0.1, max_batches: Optional[int] = None) -> dict:
+    """보존 기간이 지난 삭제/숨김 댓글을 작은 트랜잭션 단위로 아카이브"""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    stats = {"batches": 0, "comments_archived": 0, "likes_archived": 0, "elapsed_seconds": 0.0}
+    started = time.monotonic()
+    last_id = 0
+
+    while max_batches is None or stats["batches"] < max_batches:
+        comment_ids = db.session.execute(
+            select(Comment.id)
+            .where(
+                Comment.status.in_(ARCHIVABLE_STATUSES),
+                Comment.updated_at < cutoff,
+                Comment.id > last_id
+            )
+            .order_by(Comment.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not comment_ids:
+            break
+
+        try:
+            comments_archived, likes_archived = _archive_batch(comment_ids, cutoff)
+        except Exception:
+            db.session.rollback()
+            raise
+
+        last_id = comment_ids[-1]
+        stats["batches"] += 1
+        stats["comments_archived"] += comments_archived
+        stats["likes_archived"] += likes_archived
+        logger.info(
+            f"아카이브 진행 - batch: {stats['batches']}, comments: {stats['comments_archived']}, "
+            f"likes: {stats['likes_archived']}, last_id: {last_id}"
+        )
+
+        if len(comment_ids) < batch_size:
+            break
+        # 운영 DB 부하를 줄이기 위한 배치 간 대기
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    stats["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    logger.info(f"아카이브 완료 - {stats}")
+    return stats
+
+
+def purge_orphan_likes(batch_size: int = 1000, sleep_seconds: float = 0.1) -> dict:
+    """존재하지 않는 댓글을 가리키는 좋아요를 배치 단위로 삭제"""
+    likes = CommentLike.__table__
+    stats = {"batches": 0, "likes_purged": 0, "elapsed_seconds": 0.0}
+    started = time.monotonic()
+
+    while True:
+        like_ids = db.session.execute(
+            select(likes.c.id)
+            .outerjoin(Comment.__table__, Comment.id == likes.c.comment_id)
+            .where(Comment.id.is_(None))
+            .order_by(likes.c.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not like_ids:
+            break
+
+        db.session.execute(delete(likes).where(likes.c.id.in_(like_ids)))
+        db.session.commit()
+
+        stats["batches"] += 1
+        stats["likes_purged"] += len(like_ids)
+        logger.info(f"고아 좋아요 정리 진행 - batch: {stats['batches']}, likes: {stats['likes_purged']}")
+
+        if len(like_ids) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    stats["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    logger.info(f"고아 좋아요 정리 완료 - {stats}")
+    return stats
@@ -0,0 +1,86 @@
+"""
+Comment Service 비동기 DB 엔진
+읽기 위주 async 뷰에서 사용하는 AsyncEngine(aiosqlite/aiomysql)을 관리합니다.
+
+- ASYNC_VIEWS_ENABLED가 꺼져 있으면(기본) 엔진을 만들지 않고 조회 뷰는 동기 경로를 사용합니다.
+- ASYNC_DATABASE_URI가 없으면 동기 엔진 URL의 드라이버만 바꿔 사용합니다.
+  (sqlite -> sqlite+aiosqlite, mysql/mysql+pymysql -> mysql+aiomysql)
+- 인메모리 SQLite처럼 동기 엔진과 같은 DB를 볼 수 없는 경우에는 비활성화되며,
+  AsyncCommentService는 동기 CommentService로 대신 처리합니다.
+- Flask(WSGI) async 뷰는 요청마다 새 이벤트 루프에서 실행되므로 커넥션을 루프 간에 공유할 수 없어
+  기본은 NullPool입니다 (요청마다 연결, ASYNC_DB_POOL_SIZE=0).
+- ASGI 엔트리포인트(asgi.py)는 async 뷰를 서버 이벤트 루프 하나에서 실행하므로
+  ASYNC_DB_POOL_SIZE만큼 커넥션 풀을 사용합니다.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from flask import current_app
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool
+
+from .models import db
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def async_database_uri(uri) -> Optional[str]:
+    """동기 DB URI를 비동기 드라이버 URI로 변환 - 변환할 수 없으면 None"""
+    url = make_url(uri)
+    if url.drivername in ASYNC_DRIVERS.values():
+        return url.render_as_string(hide_password=False)
+    if url.drivername not in ASYNC_DRIVERS:
+        return None
+    if url.drivername.startswith("sqlite") and url.database in (None, "", ":memory:"):
+        # 인메모리 DB는 연결마다 별도 DB이므로 동기 엔진과 공유 불가
+        return None
+    return url.set(drivername=ASYNC_DRIVERS[url.drivername]).render_as_string(hide_password=False)
+
+
+def init_async_db(app):
+    """앱에 비동기 엔진 등록 (async 뷰를 끄거나 드라이버가 없거나 변환 불가하면 비활성화)"""
+    if not app.config.get("ASYNC_VIEWS_ENABLED"):
+        app.extensions["comment_async_db"] = None
+        return None
+
+    uri = app.config.get("ASYNC_DATABASE_URI")
+    if not uri:
+        # 상대 경로 SQLite는 Flask-SQLAlchemy가 instance 폴더로 바꾸므로 실제 엔진 URL 기준으로 변환
+        with app.app_context():
+            uri = async_database_uri(db.engine.url)
+    engine = None
+    if uri:
+        pool_size = app.config.get("ASYNC_DB_POOL_SIZE", 0)
+        if pool_size > 0:
+            pool_options = {"pool_size": pool_size, "pool_pre_ping": True, "pool_recycle": 3600}
+        else:
+            pool_options = {"poolclass": NullPool}
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+            engine = create_async_engine(uri, **pool_options)
+        except ImportError as e:
+            logger.warning(f"비동기 DB 드라이버를 불러올 수 없어 동기 경로를 사용합니다: {e}")
+    app.extensions["comment_async_db"] = engine
+    logger.info(f"Async DB engine: {engine.url.drivername if engine else 'disabled'}, "
+                f"pool: {engine.pool.status() if engine else '-'}")
+    return engine
+
+
+def get_async_engine():
+    return current_app.extensions.get("comment_async_db")
+
+
+@asynccontextmanager
+async def async_connection():
+    """읽기 전용 비동기 연결"""
+    async with get_async_engine().connect() as conn:
+        yield conn
@@ -0,0 +1,74 @@
+"""
+Comment Service 비동기 읽기 경로
+CommentService의 조회 메서드에 대응하는 async 버전입니다. 조회문은 CommentService와 공유하고
+비동기 엔진(comment/async_db.py)으로 실행합니다. 비동기 엔진이 비활성화되어 있으면
+동기 CommentService 결과를 그대로 반환합니다.
+
+한 요청의 조회는 연결 하나에서 차례로 실행합니다 (NullPool이면 요청마다 새 연결).
+
+쓰기 경로(생성/수정/삭제/좋아요)는 검색 색인, 카운터, 아웃박스를 같은 트랜잭션에서 다루므로
+동기 CommentService만 사용합니다.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select
+
+from .async_db import async_connection, get_async_engine
+from .dto import CommentRecord
+from .models import CommentLike, UserCommentStats
+from .services import CommentService
+
+
+class AsyncCommentService:
+    """댓글 비동기 조회 서비스 클래스"""
+
+    @staticmethod
+    async def get_comments(post_id: int, skip: int = 0, limit: int = 10,
+                           sort_by: str = "created_at", sort_order: str = "desc") -> Tuple[List[CommentRecord], int]:
+        """특정 게시글의 댓글 목록 조회"""
+        if get_async_engine() is None:
+            return CommentService.get_comments(post_id, skip=skip, limit=limit,
+                                               sort_by=sort_by, sort_order=sort_order)
+
+        stmt, count_stmt = CommentService._comments_query(post_id, sort_by, sort_order)
+        async with async_connection() as conn:
+            total = (await conn.execute(count_stmt)).scalar()
+            rows = (await conn.execute(stmt.offset(skip).limit(limit))).all()
+        return [CommentRecord.from_row(row) for row in rows], total
+
+    @staticmethod
+    async def get_user_comments_page(user_id: str, skip: int = 0, limit: int = 10,
+                                     cursor: Optional[str] = None) -> Tuple[List[CommentRecord], Optional[str], int]:
+        """특정 사용자가 작성한 댓글 페이지와 보이는 댓글 수 조회 - (댓글 목록, 다음 커서, 총 개수)
+
+        개수 캐시 행이 없으면 동기 경로에서 계산 후 저장합니다.
+        """
+        if get_async_engine() is None:
+            comments, next_cursor = CommentService.get_comments_by_user(user_id, skip=skip, limit=limit, cursor=cursor)
+            return comments, next_cursor, CommentService.get_user_comment_count(user_id)
+
+        stmt = CommentService._user_comments_query(user_id, skip, limit, cursor)
+        async with async_connection() as conn:
+            rows = (await conn.execute(stmt)).all()
+            total = (await conn.execute(
+                select(UserCommentStats.comment_count).where(UserCommentStats.user_id == user_id)
+            )).scalar()
+        comments, next_cursor = CommentService._user_comments_page(rows, limit)
+        if total is None:
+            total = CommentService.get_user_comment_count(user_id)
+        return comments, next_cursor, total
+
+    @staticmethod
+    async def get_comment_like_status(comment_id: int, user_id: str) -> bool:
+        """사용자의 댓글 좋아요 상태 확인"""
+        if get_async_engine() is None:
+            return CommentService.get_comment_like_status(comment_id, user_id)
+
+        async with async_connection() as conn:
+            like_id = (await conn.execute(
+                select(CommentLike.id)
+                .where(CommentLike.comment_id == comment_id, CommentLike.user_id == user_id)
+                .limit(1)
+            )).scalar()
+        return like_id is not None
@@ -0,0 +1,149 @@
+"""
+Comment Service CLI 명령어
+`flask comments <command>` 형태로 실행합니다. (Kubernetes CronJob 등 배치 작업용)
+"""
+
+import json
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from .archive import archive_comments, purge_orphan_likes
+from .export import FORMATS as EXPORT_FORMATS, iter_comment_rows, iter_export
+from .idempotency import purge_expired as purge_expired_idempotency_keys
+from .ingest import INGEST_CHUNK_SIZE, ingest_comments, iter_ndjson
+from .outbox import OutboxDispatcher, create_sink, lag_metrics, purge_dispatched, requeue_failed
+from .ranking import refresh_scores
+
+comments_cli = AppGroup("comments", help="댓글 서비스 배치 작업")
+
+
+@comments_cli.command("archive")
+@click.option("--retention-days", type=int, default=None, help="삭제/숨김 후 보존 기간(일)")
+@click.option("--batch-size", type=int, default=None, help="트랜잭션당 댓글 수")
+@click.option("--sleep", "sleep_seconds", type=float, default=None, help="배치 간 대기 시간(초)")
+@click.option("--max-batches", type=int, default=None, help="최대 배치 수 (기본: 제한 없음)")
+def archive_command(retention_days, batch_size, sleep_seconds, max_batches):
+    """보존 기간이 지난 삭제/숨김 댓글을 아카이브 테이블로 이동"""
+    config = current_app.config
+    stats = archive_comments(
+        retention_days=retention_days if retention_days is not None else config["ARCHIVE_RETENTION_DAYS"],
+        batch_size=batch_size or config["ARCHIVE_BATCH_SIZE"],
+        sleep_seconds=sleep_seconds if sleep_seconds is not None else config["ARCHIVE_SLEEP_SECONDS"],
+        max_batches=max_batches
+    )
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("purge-likes")
+@click.option("--batch-size", type=int, default=None, help="트랜잭션당 좋아요 수")
+@click.option("--sleep", "sleep_seconds", type=float, default=None, help="배치 간 대기 시간(초)")
+def purge_likes_command(batch_size, sleep_seconds):
+    """존재하지 않는 댓글을 가리키는 좋아요 삭제"""
+    config = current_app.config
+    stats = purge_orphan_likes(
+        batch_size=batch_size or config["ARCHIVE_BATCH_SIZE"],
+        sleep_seconds=sleep_seconds if sleep_seconds is not None else config["ARCHIVE_SLEEP_SECONDS"]
+    )
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("purge-idempotency")
+@click.option("--batch-size", type=int, default=None, help="트랜잭션당 삭제할 키 수")
+def purge_idempotency_command(batch_size):
+    """만료된 Idempotency-Key 레코드 삭제"""
+    config = current_app.config
+    stats = purge_expired_idempotency_keys(
+        batch_size=batch_size or config["ARCHIVE_BATCH_SIZE"],
+        sleep_seconds=config["ARCHIVE_SLEEP_SECONDS"]
+    )
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("import")
+@click.argument("source", type=click.File("rb"))
+@click.option("--chunk-size", type=int, default=INGEST_CHUNK_SIZE, help="트랜잭션당 INSERT 행 수")
+def import_command(source, chunk_size):
+    """NDJSON 파일(또는 '-'로 표준입력)의 댓글을 대량 적재"""
+    stats = ingest_comments(iter_ndjson(source), chunk_size=chunk_size)
+    click.echo(json.dumps(stats, ensure_ascii=False))
+
+
+@comments_cli.command("dispatch-outbox")
+@click.option("--loop/--once", default=False, help="계속 실행(--loop) 또는 한 배치만 처리(--once)")
+@click.option("--batch-size", type=int, default=None, help="배치당 이벤트 수")
+@click.option("--max-batches", type=int, default=None, help="최대 배치 수 (--loop 전용)")
+def dispatch_outbox_command(loop, batch_size, max_batches):
+    """아웃박스의 미발행 이벤트를 싱크로 전달"""
+    config = current_app.config
+    dispatcher = OutboxDispatcher(
+        create_sink(),
+        batch_size=batch_size or config["OUTBOX_BATCH_SIZE"],
+        max_attempts=config["OUTBOX_MAX_ATTEMPTS"],
+        retry_seconds=config["OUTBOX_RETRY_SECONDS"]
+    )
+    if loop:
+        stats = dispatcher.run(poll_interval=config["OUTBOX_POLL_INTERVAL"], max_batches=max_batches)
+    else:
+        stats = dispatcher.dispatch_once()
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("outbox-stats")
+def outbox_stats_command():
+    """아웃박스 미발행 이벤트 수와 지연 시간 출력"""
+    click.echo(json.dumps(lag_metrics()))
+
+
+@comments_cli.command("requeue-outbox")
+@click.option("--post-id", default=None, help="특정 게시글의 이벤트만 되돌림")
+def requeue_outbox_command(post_id):
+    """전달을 포기한(dead letter) 이벤트를 다시 전달 대상으로 되돌림"""
+    click.echo(json.dumps({"events_requeued": requeue_failed(post_id)}))
+
+
+@comments_cli.command("purge-outbox")
+@click.option("--retention-days", type=int, default=None, help="발행 완료 이벤트 보존 기간(일)")
+def purge_outbox_command(retention_days):
+    """보존 기간이 지난 발행 완료 이벤트 삭제"""
+    config = current_app.config
+    stats = purge_dispatched(
+        retention_days=retention_days if retention_days is not None else config["OUTBOX_RETENTION_DAYS"],
+        batch_size=config["ARCHIVE_BATCH_SIZE"]
+    )
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("refresh-scores")
+@click.option("--max-age-days", type=int, default=None, help="재계산 대상 작성 기간(일)")
+@click.option("--all", "all_comments", is_flag=True, help="기간 제한 없이 전체 재계산 (최초 백필용)")
+@click.option("--batch-size", type=int, default=1000, help="트랜잭션당 댓글 수")
+def refresh_scores_command(max_age_days, all_comments, batch_size):
+    """best 정렬 점수에 시간 감쇠 반영"""
+    if all_comments:
+        max_age_days = None
+    elif max_age_days is None:
+        max_age_days = current_app.config["RANKING_DECAY_DAYS"]
+    stats = refresh_scores(
+        max_age_days=max_age_days,
+        batch_size=batch_size,
+        sleep_seconds=current_app.config["ARCHIVE_SLEEP_SECONDS"]
+    )
+    click.echo(json.dumps(stats))
+
+
+@comments_cli.command("export")
+@click.option("--post-id", default=None, help="내보낼 게시글 ID")
+@click.option("--user-id", default=None, help="내보낼 사용자 ID")
+@click.option("--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="ndjson", help="출력 형식")
+@click.option("--gzip", "use_gzip", is_flag=True, help="gzip 압축")
+@click.option("--include-hidden", is_flag=True, help="숨김/삭제 댓글 포함")
+@click.option("-o", "--output", type=click.File("wb"), default="-", help="출력 파일 (기본: 표준출력)")
+def export_command(post_id, user_id, fmt, use_gzip, include_hidden, output):
+    """게시글 또는 사용자의 댓글을 NDJSON/CSV로 스트리밍 내보내기"""
+    if not post_id and not user_id:
+        raise click.UsageError("--post-id 또는 --user-id가 필요합니다")
+    rows = iter_comment_rows(post_id=post_id, user_id=user_id, include_hidden=include_hidden)
+    for chunk in iter_export(rows, fmt=fmt, gzip=use_gzip):
+        output.write(chunk)
@@ -0,0 +1,62 @@
+"""
+Comment Service 사용자별 댓글 수 카운터
+user_comment_stats 행은 처음 조회할 때 (user_id, status, created_at, id) 인덱스로 COUNT하여 만들고,
+이후에는 댓글 변경과 같은 트랜잭션에서 증감만 반영합니다.
+아직 행이 없는 사용자의 증감은 무시합니다 (첫 조회 시 정확한 값으로 생성).
+"""
+
+from typing import Dict
+
+from sqlalchemy import bindparam, case, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+
+from .models import db, Comment, UserCommentStats
+from .schema import ensure_index
+
+USER_COMMENTS_INDEX = "ix_comments_user_status_created_id"
+
+
+def ensure_user_comments_index() -> bool:
+    """기존 comments 테이블에 내 댓글 목록/개수 조회용 (user_id, status, created_at, id) 인덱스 추가"""
+    return ensure_index(Comment.__table__, USER_COMMENTS_INDEX)
+
+
+def adjust_user_counts(deltas: Dict[str, int]) -> None:
+    """사용자별 댓글 수 증감 - 커밋 전에 호출 (같은 트랜잭션)"""
+    params = [{"b_user_id": user_id, "b_delta": delta} for user_id, delta in deltas.items() if delta]
+    if not params:
+        return
+    stats = UserCommentStats.__table__
+    new_count = stats.c.comment_count + bindparam("b_delta")
+    # 사용자 수만큼의 UPDATE를 executemany 한 번으로 실행
+    db.session.execute(
+        update(stats)
+        .where(stats.c.user_id == bindparam("b_user_id"))
+        .values(comment_count=case((new_count < 0, 0), else_=new_count)),
+        params
+    )
+
+
+def get_user_comment_count(user_id: str) -> int:
+    """사용자의 보이는 댓글 수 (캐시가 없으면 계산 후 저장)"""
+    count_stmt = select(UserCommentStats.comment_count).where(UserCommentStats.user_id == user_id)
+    count = db.session.execute(count_stmt).scalar()
+    if count is not None:
+        return count
+
+    # COUNT와 행 생성을 INSERT ... SELECT 한 문장으로 실행 - 따로 실행하면 그 사이에 커밋된
+    # 댓글 변경의 증감이 (행이 없어) 무시된 채 오래된 개수가 저장됨
+    stats = UserCommentStats.__table__
+    try:
+        db.session.execute(
+            insert(stats).from_select(
+                ["user_id", "comment_count"],
+                select(literal(user_id), func.count(Comment.id))
+                .where(Comment.user_id == user_id, Comment.status == "visible")
+            )
+        )
+        db.session.commit()
+    except IntegrityError:
+        # 동시 요청이 먼저 생성함
+        db.session.rollback()
+    return db.session.execute(count_stmt).scalar() or 0
@@ -0,0 +1,52 @@
+"""
+Comment Service 읽기 전용 댓글 레코드
+목록/권한 확인처럼 조회 후 바로 버리는 경로에서는 ORM 객체(identity map 등록, 속성 계측) 대신
+Core 조회 결과로 만든 __slots__ 레코드를 반환합니다. to_dict() 결과는 Comment.to_dict()와 같습니다.
+"""
+
+from .models import Comment
+
+
+class CommentRecord:
+    """댓글 한 건의 읽기 전용 값"""
+
+    __slots__ = ("id", "post_id", "user_id", "user_name", "content", "status",
+                 "like_count", "created_at", "updated_at")
+
+    def __init__(self, id, post_id, user_id, user_name, content, status,
+                 like_count, created_at, updated_at):
+        self.id = id
+        self.post_id = post_id
+        self.user_id = user_id
+        self.user_name = user_name
+        self.content = content
+        self.status = status
+        self.like_count = like_count
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_row(cls, row) -> "CommentRecord":
+        """COMMENT_COLUMNS 순서로 시작하는 조회 행에서 생성 (뒤에 붙은 정렬 키 등은 무시)"""
+        return cls(*row[:len(cls.__slots__)])
+
+    def to_dict(self):
+        """레코드를 딕셔너리로 변환"""
+        return {
+            "id": self.id,
+            "post_id": self.post_id,
+            "user_id": self.user_id,
+            "user_name": self.user_name,
+            "content": self.content,
+            "status": self.status.value,
+            "like_count": self.like_count,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f"<CommentRecord id={self.id} post_id={self.post_id}>"
+
+
+# select(*COMMENT_COLUMNS)로 조회하면 CommentRecord.from_row로 바로 변환할 수 있음
+COMMENT_COLUMNS = tuple(Comment.__table__.c[name] for name in CommentRecord.__slots__)
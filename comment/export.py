@@ -0,0 +1,127 @@
+"""
+Comment Service 댓글 내보내기 (NDJSON/CSV 스트리밍)
+게시글 또는 사용자의 댓글을 id 순 keyset 청크와 서버 측 커서(stream_results)로 읽어
+한 줄씩 출력하므로 댓글 수와 관계없이 메모리 사용량이 일정합니다.
+숨김/삭제 댓글을 포함하면 아카이브 테이블(comments_archive)로 옮겨진 댓글도 이어서 출력합니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+
+from .models import db, Comment, CommentArchive
+
+EXPORT_CHUNK_SIZE = 1000
+FORMATS = ("ndjson", "csv")
+
+EXPORT_COLUMNS = ["id", "post_id", "user_id", "user_name", "content", "status",
+                  "like_count", "created_at", "updated_at"]
+
+
+def iter_comment_rows(post_id: Optional[str] = None, user_id: Optional[str] = None,
+                      include_hidden: bool = False, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator:
+    """댓글 행을 id 순서로 청크 단위 조회 - ORM 객체 대신 Core 행을 반환
+
+    include_hidden이면 comments 다음에 comments_archive 행을 id 순서로 이어서 반환합니다.
+    내보내는 도중 아카이브된 댓글은 두 번 나올 수 있지만 누락되지는 않습니다.
+    """
+    tables = [Comment.__table__]
+    if include_hidden:
+        # 아카이브 행은 모두 삭제/숨김 상태이므로 숨김 포함일 때만 대상
+        tables.append(CommentArchive.__table__)
+
+    for table in tables:
+        conditions = []
+        if post_id is not None:
+            conditions.append(table.c.post_id == post_id)
+        if user_id is not None:
+            conditions.append(table.c.user_id == user_id)
+        if not include_hidden:
+            conditions.append(table.c.status == "visible")
+        yield from _iter_table_rows(table, conditions, chunk_size)
+
+
+def _iter_table_rows(table, conditions: list, chunk_size: int) -> Iterator:
+    last_id = 0
+    while True:
+        result = db.session.execute(
+            select(*[table.c[name] for name in EXPORT_COLUMNS])
+            .where(*conditions, table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(chunk_size)
+            .execution_options(stream_results=True, yield_per=chunk_size)
+        )
+        count = 0
+        for row in result:
+            count += 1
+            last_id = row.id
+            yield row
+        # 청크 사이에 트랜잭션을 끝내 긴 스냅샷/잠금을 유지하지 않음
+        db.session.commit()
+        if count < chunk_size:
+            break
+
+
+def _row_values(row) -> list:
+    return [
+        row.id,
+        row.post_id,
+        row.user_id,
+        row.user_name,
+        row.content,
+        row.status.value if row.status is not None else None,
+        row.like_count,
+        row.created_at.isoformat() if row.created_at else None,
+        row.updated_at.isoformat() if row.updated_at else None,
+    ]
+
+
+def iter_ndjson_lines(rows) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(dict(zip(EXPORT_COLUMNS, _row_values(row))), ensure_ascii=False) + "\n"
+
+
+def iter_csv_lines(rows) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for row in rows:
+        writer.writerow(_row_values(row))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    # 행이 하나도 없어도 헤더는 출력
+    if buffer.getvalue():
+        yield buffer.getvalue()
+
+
+def iter_export(rows, fmt: str = "ndjson", gzip: bool = False,
+                flush_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """행 스트림을 NDJSON/CSV 바이트 청크로 변환 (gzip 선택)"""
+    lines = iter_csv_lines(rows) if fmt == "csv" else iter_ndjson_lines(rows)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if gzip else None
+
+    pending = []
+    pending_size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        pending.append(data)
+        pending_size += len(data)
+        # 작은 write를 모아 응답 청크 수를 줄임
+        if pending_size >= flush_bytes:
+            chunk = b"".join(pending)
+            pending, pending_size = [], 0
+            if compressor:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                yield chunk
+
+    chunk = b"".join(pending)
+    if compressor:
+        chunk = compressor.compress(chunk) + compressor.flush()
+    if chunk:
+        yield chunk
@@ -0,0 +1,168 @@
+"""
+Comment Service Idempotency-Key 저장소
+재시도된 요청은 저장된 응답을 그대로 돌려주고 다시 실행하지 않습니다.
+"""
+
+import hashlib
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+
+from .models import db, IdempotencyKey
+from .schema import ensure_columns
+
+logger = logging.getLogger(__name__)
+
+MAX_KEY_LENGTH = 255
+DEFAULT_LOCK_SECONDS = 60
+
+# begin() 결과 상태
+STARTED = "started"
+REPLAY = "replay"
+IN_PROGRESS = "in_progress"
+MISMATCH = "mismatch"
+
+
+def ensure_lock_columns() -> bool:
+    """기존 idempotency_keys 테이블에 임대 컬럼이 없으면 추가 - 추가했으면 True"""
+    return ensure_columns(IdempotencyKey.__table__, {"lock_token": "VARCHAR(32)", "locked_at": "DATETIME"})
+
+
+def request_fingerprint(method: str, path: str, body: bytes) -> str:
+    """같은 키로 다른 요청을 보냈는지 판별하기 위한 요청 지문"""
+    digest = hashlib.sha256()
+    digest.update(method.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(path.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def begin(user_id: str, key: str, fingerprint: str, ttl_seconds: int,
+          lock_seconds: int = DEFAULT_LOCK_SECONDS) -> Tuple[str, Optional[IdempotencyKey]]:
+    """키 처리를 시작 - 이미 처리된 키면 저장된 레코드를 반환
+
+    처리 중(status_code NULL)인 키라도 lock_seconds가 지나도록 완료되지 않았으면
+    처리하던 요청이 중단된 것으로 보고 이번 요청이 넘겨받습니다.
+    """
+    now = datetime.utcnow()
+    record = IdempotencyKey.query.filter_by(user_id=user_id, key=key).first()
+
+    if record and record.expires_at <= now:
+        db.session.delete(record)
+        db.session.commit()
+        record = None
+
+    if record:
+        if record.request_hash != fingerprint:
+            return MISMATCH, record
+        if record.status_code is None:
+            if _take_over(record, now, lock_seconds):
+                return STARTED, record
+            return IN_PROGRESS, record
+        return REPLAY, record
+
+    record = IdempotencyKey(
+        user_id=user_id,
+        key=key,
+        request_hash=fingerprint,
+        lock_token=uuid.uuid4().hex,
+        locked_at=now,
+        expires_at=now + timedelta(seconds=ttl_seconds)
+    )
+    db.session.add(record)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # 같은 키의 동시 요청이 먼저 등록됨
+        db.session.rollback()
+        return IN_PROGRESS, None
+    return STARTED, record
+
+
+def _take_over(record: IdempotencyKey, now: datetime, lock_seconds: int) -> bool:
+    """임대가 만료된 처리 중 키를 넘겨받음 - 동시에 재시도한 요청 중 하나만 성공"""
+    locked_at = record.locked_at or record.created_at
+    if locked_at and locked_at > now - timedelta(seconds=lock_seconds):
+        return False
+
+    token = uuid.uuid4().hex
+    result = db.session.execute(
+        update(IdempotencyKey)
+        .where(
+            IdempotencyKey.id == record.id,
+            IdempotencyKey.status_code.is_(None),
+            IdempotencyKey.lock_token.is_(None) if record.lock_token is None
+            else IdempotencyKey.lock_token == record.lock_token
+        )
+        .values(lock_token=token, locked_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    if not result.rowcount:
+        return False
+
+    logger.warning(f"중단된 Idempotency-Key 처리를 넘겨받음 - id: {record.id}, locked_at: {locked_at}")
+    db.session.refresh(record)
+    return True
+
+
+def _owned(record_id: int, lock_token: Optional[str]):
+    """아직 이 요청이 처리 중인 키인지 확인하는 조건 (임대를 넘겨준 뒤 늦게 끝난 요청은 무시)"""
+    return (
+        IdempotencyKey.id == record_id,
+        IdempotencyKey.status_code.is_(None),
+        IdempotencyKey.lock_token == lock_token,
+    )
+
+
+def complete(record_id: int, status_code: int, response_body: str, lock_token: Optional[str] = None) -> None:
+    """처리 결과 저장"""
+    db.session.execute(
+        update(IdempotencyKey)
+        .where(*_owned(record_id, lock_token))
+        .values(status_code=status_code, response_body=response_body)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+
+def release(record_id: int, lock_token: Optional[str] = None) -> None:
+    """서버 오류 등으로 결과를 저장하지 않을 때 키를 해제해 재시도를 허용"""
+    db.session.rollback()
+    db.session.execute(delete(IdempotencyKey).where(*_owned(record_id, lock_token)))
+    db.session.commit()
+
+
+def purge_expired(batch_size: int = 1000, sleep_seconds: float = 0.1) -> dict:
+    """만료된 키를 배치 단위로 삭제"""
+    stats = {"batches": 0, "keys_purged": 0}
+    now = datetime.utcnow()
+
+    while True:
+        key_ids = db.session.execute(
+            select(IdempotencyKey.id)
+            .where(IdempotencyKey.expires_at <= now)
+            .limit(batch_size)
+        ).scalars().all()
+        if not key_ids:
+            break
+
+        db.session.execute(delete(IdempotencyKey).where(IdempotencyKey.id.in_(key_ids)))
+        db.session.commit()
+        stats["batches"] += 1
+        stats["keys_purged"] += len(key_ids)
+
+        if len(key_ids) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    logger.info(f"만료된 Idempotency-Key 정리 완료 - {stats}")
+    return stats
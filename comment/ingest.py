@@ -0,0 +1,214 @@
+"""
+Comment Service 대량 적재(ingestion)
+레거시 시스템 마이그레이션/백필용으로 NDJSON 입력을 스트리밍으로 읽어
+청크 단위 multi-row INSERT(executemany)로 적재합니다.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import IO, Iterable, Iterator, Tuple
+
+from sqlalchemy import inspect, insert, select, text
+
+from .models import db, Comment, CommentArchive, CommentStatus
+from . import counters, outbox, ranking, search
+from .schema import ensure_index
+
+logger = logging.getLogger(__name__)
+
+INGEST_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 20
+SOURCE_ID_INDEX = "uq_comments_source_id"
+ARCHIVE_SOURCE_ID_INDEX = "ix_comments_archive_source_id"
+
+
+def ensure_source_id_column() -> bool:
+    """기존 comments/comments_archive 테이블에 source_id 컬럼과 인덱스가 없으면 추가 - 추가했으면 True"""
+    inspector = inspect(db.engine)
+    added = False
+    for table in (Comment.__table__, CommentArchive.__table__):
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        if "source_id" not in columns:
+            db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN source_id VARCHAR(100)"))
+            db.session.commit()
+            added = True
+    ensure_index(Comment.__table__, SOURCE_ID_INDEX)
+    ensure_index(CommentArchive.__table__, ARCHIVE_SOURCE_ID_INDEX)
+    return added
+
+
+def iter_ndjson(stream: IO) -> Iterator[Tuple[int, dict]]:
+    """NDJSON 스트림을 한 줄씩 읽어 (줄 번호, 객체)를 반환 - 전체를 메모리에 올리지 않음"""
+    for line_no, line in enumerate(stream, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, None
+
+
+def validate_comment_row(raw) -> dict:
+    """입력 한 건을 검증하고 comments 테이블 INSERT 파라미터로 변환"""
+    if not isinstance(raw, dict):
+        raise ValueError("invalid JSON object")
+
+    for field in ("post_id", "user_id", "content"):
+        value = raw.get(field)
+        if value is None or not str(value).strip():
+            raise ValueError(f"{field} is required")
+
+    post_id = str(raw["post_id"])
+    if len(post_id) > 32:
+        raise ValueError("post_id is too long")
+    user_id = str(raw["user_id"])
+    user_name = str(raw.get("user_name") or "Unknown")
+    if len(user_id) > 100 or len(user_name) > 100:
+        raise ValueError("user_id/user_name is too long")
+
+    try:
+        status = CommentStatus(raw.get("status", "visible"))
+    except ValueError:
+        raise ValueError("invalid status")
+
+    like_count = raw.get("like_count", 0)
+    if isinstance(like_count, bool) or not isinstance(like_count, int) or like_count < 0:
+        raise ValueError("like_count must be a non-negative integer")
+
+    source_id = raw.get("source_id", raw.get("legacy_id"))
+    if source_id is not None:
+        source_id = str(source_id)
+        if not source_id or len(source_id) > 100:
+            raise ValueError("source_id must be 1-100 characters")
+
+    created_at = raw.get("created_at")
+    if created_at:
+        try:
+            created_at = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError("invalid created_at")
+        # 오프셋이 있으면 UTC로 변환, 없으면 UTC로 간주 (DB에는 UTC naive로 저장)
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    else:
+        created_at = datetime.utcnow()
+
+    # executemany는 모든 행의 키가 같아야 하므로 기본값까지 채워서 반환
+    return {
+        "post_id": post_id,
+        "user_id": user_id,
+        "user_name": user_name,
+        "content": str(raw["content"]),
+        "status": status,
+        "like_count": like_count,
+        "score": ranking.compute_score(like_count, created_at),
+        "created_at": created_at,
+        "updated_at": created_at,
+        "source_id": source_id,
+    }
+
+
+def _skip_imported(rows: list) -> list:
+    """이미 적재된(보관된 것 포함) source_id와 청크 내 중복을 제외 - 재실행해도 같은 댓글을 다시 넣지 않음"""
+    source_ids = {row["source_id"] for row in rows if row["source_id"] is not None}
+    if not source_ids:
+        return rows
+
+    seen = set()
+    for table in (Comment.__table__, CommentArchive.__table__):
+        seen.update(db.session.execute(
+            select(table.c.source_id).where(table.c.source_id.in_(source_ids))
+        ).scalars())
+
+    fresh = []
+    for row in rows:
+        if row["source_id"] is not None:
+            if row["source_id"] in seen:
+                continue
+            seen.add(row["source_id"])
+        fresh.append(row)
+    return fresh
+
+
+def _insert_chunk(rows: list) -> int:
+    """한 청크를 하나의 트랜잭션으로 적재 - 실제 적재한 행 수 반환"""
+    comments = Comment.__table__
+    try:
+        rows = _skip_imported(rows)
+        if not rows:
+            db.session.commit()
+            return 0
+
+        if search.get_backend() == search.BACKEND_FTS5:
+            # FTS5 인덱스 동기화를 위해 생성된 id를 함께 받아옴
+            inserted = db.session.execute(
+                insert(comments).returning(comments.c.id, comments.c.content), rows
+            ).all()
+            search.index_comments([(row.id, row.content) for row in inserted])
+        else:
+            db.session.execute(insert(comments), rows)
+
+        # 게시글별 적재 건수는 이벤트로 기록 (댓글 수 카운터 등 소비자용), 사용자별 건수는 캐시에 반영
+        counts = {}
+        user_counts = {}
+        for row in rows:
+            if row["status"] == CommentStatus.visible:
+                counts[row["post_id"]] = counts.get(row["post_id"], 0) + 1
+                user_counts[row["user_id"]] = user_counts.get(row["user_id"], 0) + 1
+        counters.adjust_user_counts(user_counts)
+        outbox.record_many([
+            (outbox.COMMENT_IMPORTED, post_id, {"post_id": post_id, "count": count})
+            for post_id, count in counts.items()
+        ])
+        db.session.commit()
+        return len(rows)
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def ingest_comments(records: Iterable[Tuple[int, dict]], chunk_size: int = INGEST_CHUNK_SIZE) -> dict:
+    """(줄 번호, 객체) 스트림을 검증하며 청크 단위로 적재하고 처리 통계를 반환"""
+    stats = {"received": 0, "inserted": 0, "skipped": 0, "rejected": 0, "chunks": 0,
+             "errors": [], "elapsed_seconds": 0.0, "rows_per_second": 0.0}
+    started = time.monotonic()
+    chunk = []
+
+    def flush():
+        inserted = _insert_chunk(chunk)
+        stats["inserted"] += inserted
+        stats["skipped"] += len(chunk) - inserted
+        stats["chunks"] += 1
+        chunk.clear()
+
+    for line_no, raw in records:
+        stats["received"] += 1
+        try:
+            chunk.append(validate_comment_row(raw))
+        except ValueError as e:
+            stats["rejected"] += 1
+            if len(stats["errors"]) < MAX_REPORTED_ERRORS:
+                stats["errors"].append({"line": line_no, "error": str(e)})
+            continue
+
+        if len(chunk) >= chunk_size:
+            flush()
+            if stats["chunks"] % 10 == 0:
+                logger.info(f"댓글 적재 진행 - inserted: {stats['inserted']}, rejected: {stats['rejected']}")
+
+    if chunk:
+        flush()
+
+    elapsed = time.monotonic() - started
+    stats["elapsed_seconds"] = round(elapsed, 3)
+    stats["rows_per_second"] = round(stats["inserted"] / elapsed, 1) if elapsed > 0 else 0.0
+    logger.info(
+        f"댓글 적재 완료 - inserted: {stats['inserted']}, skipped: {stats['skipped']}, rejected: {stats['rejected']}, "
+        f"rows/s: {stats['rows_per_second']}"
+    )
+    return stats
@@ -3,8 +3,9 @@ Comment Service 데이터베이스 모델
 """
 
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, func, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Float, func, ForeignKey, Index, UniqueConstraint
 import enum
+import json
 from datetime import datetime
 
 db = SQLAlchemy()
@@ -16,6 +17,12 @@ class CommentStatus(str, enum.Enum):
 
 class Comment(db.Model):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_status_updated_at", "status", "updated_at"),  # 아카이브 대상 스캔용
+        Index("ix_comments_post_status_score_id", "post_id", "status", "score", "id"),  # best 정렬용
+        Index("ix_comments_user_status_created_id", "user_id", "status", "created_at", "id"),  # 내 댓글 조회용
+        Index("uq_comments_source_id", "source_id", unique=True),  # 대량 적재 중복 방지용
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     post_id = Column(String(32), index=True, nullable=False)  # Post 서비스의 post ID 참조 (별도 DB)
@@ -24,6 +31,8 @@ class Comment(db.Model):
     content = Column(Text, nullable=False)
     status = Column(Enum(CommentStatus), default=CommentStatus.visible)
     like_count = Column(Integer, default=0)
+    score = Column(Float, nullable=False, default=0.0, server_default="0")  # best 정렬 점수 (comment/ranking.py)
+    source_id = Column(String(100))  # 레거시 시스템 댓글 ID (대량 적재 시에만 사용)
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -43,6 +52,9 @@ class Comment(db.Model):
 
 class CommentLike(db.Model):
     __tablename__ = "comment_likes"
+    __table_args__ = (
+        Index("uq_comment_likes_comment_user", "comment_id", "user_id", unique=True),  # 사용자당 좋아요 1개
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     comment_id = Column(Integer, index=True, nullable=False)  # Comment ID 참조
@@ -57,3 +69,83 @@ class CommentLike(db.Model):
             "user_id": self.user_id,
             "created_at": self.created_at.isoformat() if self.created_at else None
         }
+
+class UserCommentStats(db.Model):
+    """사용자별 보이는(visible) 댓글 수 캐시"""
+    __tablename__ = "user_comment_stats"
+
+    user_id = Column(String(100), primary_key=True)  # Cognito User ID
+    comment_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+class CommentArchive(db.Model):
+    """보존 기간이 지난 삭제/숨김 댓글 보관 테이블"""
+    __tablename__ = "comments_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # 원본 comments.id 유지
+    post_id = Column(String(32), index=True, nullable=False)
+    user_id = Column(String(100), nullable=False, index=True)
+    user_name = Column(String(100), nullable=False)
+    content = Column(Text, nullable=False)
+    status = Column(Enum(CommentStatus), nullable=False)
+    like_count = Column(Integer, default=0)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    source_id = Column(String(100), index=True)
+    archived_at = Column(DateTime, server_default=func.now(), index=True)
+
+class CommentLikeArchive(db.Model):
+    """보관된 댓글의 좋아요 보관 테이블"""
+    __tablename__ = "comment_likes_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # 원본 comment_likes.id 유지
+    comment_id = Column(Integer, index=True, nullable=False)
+    user_id = Column(String(100), nullable=False)
+    created_at = Column(DateTime)
+    archived_at = Column(DateTime, server_default=func.now())
+
+class IdempotencyKey(db.Model):
+    """Idempotency-Key 요청의 처리 결과 저장 (TTL 경과 후 정리)"""
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        UniqueConstraint("user_id", "key", name="uq_idempotency_keys_user_key"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)  # Cognito User ID (키는 사용자 단위로 구분)
+    key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)  # method + path + body SHA-256
+    status_code = Column(Integer)  # NULL이면 처리 중
+    response_body = Column(Text)
+    lock_token = Column(String(32))  # 처리 중인 요청 식별자 (임대 만료 후 다른 요청이 넘겨받음)
+    locked_at = Column(DateTime)  # 처리 시작(임대) 시각
+    created_at = Column(DateTime, server_default=func.now())
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+class OutboxEvent(db.Model):
+    """댓글 변경 이벤트 아웃박스 (댓글 변경과 같은 트랜잭션에서 기록)"""
+    __tablename__ = "comment_outbox"
+    __table_args__ = (
+        Index("ix_comment_outbox_dispatched_at_id", "dispatched_at", "id"),  # 미발행 이벤트 조회용
+        Index("ix_comment_outbox_post_id_id", "post_id", "id"),  # 게시글별 이벤트 재전송(SSE 재연결)용
+    )
+
+    id = Column(Integer, primary_key=True)
+    post_id = Column(String(32), nullable=False)  # 게시글 단위 순서 보장 키
+    event_type = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime, server_default=func.now())
+    dispatched_at = Column(DateTime)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime)  # 전달 실패 후 재시도 가능 시각 (그 전까지 같은 게시글 이벤트 보류)
+    failed_at = Column(DateTime)  # 최대 시도 횟수 초과로 전달을 포기한 시각 (dead letter)
+
+    def to_dict(self):
+        """모델을 딕셔너리로 변환"""
+        return {
+            "id": self.id,
+            "post_id": self.post_id,
+            "event_type": self.event_type,
+            "payload": json.loads(self.payload),
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
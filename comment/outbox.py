@@ -0,0 +1,320 @@
+"""
+Comment Service 트랜잭셔널 아웃박스
+댓글 변경 이벤트를 변경과 같은 트랜잭션에서 comment_outbox 테이블에 기록하고,
+디스패처가 배치 단위로 읽어 싱크(sink)로 전달합니다.
+
+- 전달 보장: at-least-once (싱크 전달 후 dispatched_at 기록, 실패 시 다음 배치에서 재전달)
+- 순서 보장: 같은 post_id의 이벤트는 id 순서대로 전달 (앞선 이벤트 실패 시 뒤 이벤트 보류)
+- 전달에 실패한 게시글은 재시도 대기 시간 동안 조회에서 제외되어 다른 게시글 전달을 막지 않으며,
+  최대 시도 횟수를 넘긴 이벤트는 failed_at을 기록하고 더 이상 전달하지 않습니다 (dead letter).
+  dead letter 이벤트가 있는 게시글은 requeue_failed로 되돌릴 때까지 뒤 이벤트도 보류합니다.
+- 디스패처는 한 프로세스만 실행하는 것을 전제로 합니다.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from flask import current_app
+from sqlalchemy import delete, func, insert, or_, select, update
+from werkzeug.utils import import_string
+
+from .models import db, OutboxEvent
+from .schema import ensure_columns
+
+logger = logging.getLogger(__name__)
+
+COMMENT_CREATED = "comment.created"
+COMMENT_UPDATED = "comment.updated"
+COMMENT_DELETED = "comment.deleted"
+COMMENT_STATUS_CHANGED = "comment.status_changed"
+COMMENT_IMPORTED = "comment.imported"
+COMMENT_LIKED = "comment.liked"
+COMMENT_UNLIKED = "comment.unliked"
+
+DEFAULT_MAX_ATTEMPTS = 10
+DEFAULT_RETRY_SECONDS = 30.0
+
+
+def ensure_outbox_columns() -> bool:
+    """기존 comment_outbox 테이블에 재시도/dead letter 컬럼 추가"""
+    return ensure_columns(OutboxEvent.__table__, {"next_attempt_at": "DATETIME", "failed_at": "DATETIME"})
+
+
+# ============================================================================
+# 이벤트 기록 - 커밋 전에 호출 (같은 트랜잭션)
+# ============================================================================
+
+def record(event_type: str, post_id: str, payload: dict) -> None:
+    """이벤트 한 건을 현재 세션에 추가"""
+    db.session.info["outbox_written"] = True
+    db.session.add(OutboxEvent(
+        post_id=str(post_id),
+        event_type=event_type,
+        payload=json.dumps(payload, ensure_ascii=False, default=str)
+    ))
+
+
+def record_many(events: List[tuple]) -> None:
+    """(event_type, post_id, payload) 목록을 multi-row INSERT로 기록"""
+    if not events:
+        return
+    db.session.info["outbox_written"] = True
+    db.session.execute(insert(OutboxEvent.__table__), [
+        {
+            "post_id": str(post_id),
+            "event_type": event_type,
+            "payload": json.dumps(payload, ensure_ascii=False, default=str),
+            "attempts": 0,
+        }
+        for event_type, post_id, payload in events
+    ])
+
+
+# ============================================================================
+# 싱크
+# ============================================================================
+
+class OutboxSink:
+    """이벤트 전달 대상 인터페이스 - 실패 시 예외를 발생시켜야 합니다."""
+
+    def send(self, events: List[dict]) -> None:
+        raise NotImplementedError
+
+
+class MemorySink(OutboxSink):
+    """메모리 싱크 (테스트용)"""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def send(self, events: List[dict]) -> None:
+        with self._lock:
+            self.events.extend(events)
+
+
+class FileSink(OutboxSink):
+    """NDJSON 파일 싱크 - 한 줄에 이벤트 하나씩 추가 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, events: List[dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class StdoutSink(OutboxSink):
+    """표준출력 NDJSON 싱크 - 컨테이너 로그 수집기(Fluent Bit 등)가 이벤트를 가져감"""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send(self, events: List[dict]) -> None:
+        self.stream.write("".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events))
+        self.stream.flush()
+
+
+def create_sink(app=None) -> OutboxSink:
+    """설정(OUTBOX_SINK)에 맞는 싱크 생성 - 'stdout', 'file', 'memory' 또는 'module:Class' 경로"""
+    config = (app or current_app).config
+    name = config.get("OUTBOX_SINK", "file")
+    if name == "memory":
+        return MemorySink()
+    if name == "stdout":
+        return StdoutSink()
+    if name == "file":
+        return FileSink(config.get("OUTBOX_FILE_PATH", "comment-events.ndjson"))
+    return import_string(name)()
+
+
+# ============================================================================
+# 디스패처
+# ============================================================================
+
+class OutboxDispatcher:
+    """미발행 이벤트를 배치로 읽어 싱크로 전달"""
+
+    def __init__(self, sink: OutboxSink, batch_size: int = 500,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_seconds: float = DEFAULT_RETRY_SECONDS):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+
+    def dispatch_once(self) -> dict:
+        """한 배치를 전달하고 처리 결과를 반환"""
+        now = datetime.utcnow()
+        # 재시도 대기 중이거나 dead letter 이벤트가 있는 게시글은 뒤 이벤트까지 통째로 제외 (순서 보장)
+        blocked_posts = (
+            select(OutboxEvent.post_id)
+            .where(
+                OutboxEvent.dispatched_at.is_(None),
+                or_(OutboxEvent.failed_at.isnot(None), OutboxEvent.next_attempt_at > now)
+            )
+        )
+        events = db.session.execute(
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.dispatched_at.is_(None),
+                OutboxEvent.failed_at.is_(None),
+                OutboxEvent.post_id.not_in(blocked_posts)
+            )
+            .order_by(OutboxEvent.id)
+            .limit(self.batch_size)
+        ).scalars().all()
+        stats = {"fetched": len(events), "delivered": 0, "failed_posts": 0, "dead_lettered": 0}
+        if not events:
+            return stats
+
+        # post_id별로 묶어 순서대로 전달 - 한 게시글의 실패가 다른 게시글 전달을 막지 않음
+        by_post = {}
+        for event in events:
+            by_post.setdefault(event.post_id, []).append(event)
+
+        delivered_ids = []
+        failed_ids = []
+        for post_id, post_events in by_post.items():
+            try:
+                self.sink.send([event.to_dict() for event in post_events])
+                delivered_ids.extend(event.id for event in post_events)
+            except Exception as e:
+                logger.error(f"아웃박스 전달 실패 - post_id: {post_id}, error: {e}")
+                failed_ids.extend(event.id for event in post_events)
+                stats["failed_posts"] += 1
+
+        if delivered_ids:
+            db.session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(delivered_ids))
+                .values(dispatched_at=datetime.utcnow(), attempts=OutboxEvent.attempts + 1)
+                .execution_options(synchronize_session=False)
+            )
+        if failed_ids:
+            db.session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(failed_ids))
+                .values(attempts=OutboxEvent.attempts + 1,
+                        next_attempt_at=now + timedelta(seconds=self.retry_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            dead = db.session.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(failed_ids), OutboxEvent.attempts >= self.max_attempts)
+                .values(failed_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            stats["dead_lettered"] = dead.rowcount or 0
+            if stats["dead_lettered"]:
+                logger.error(f"아웃박스 이벤트 전달 포기 (dead letter) - {stats['dead_lettered']}건")
+        db.session.commit()
+
+        stats["delivered"] = len(delivered_ids)
+        return stats
+
+    def run(self, poll_interval: float = 1.0, max_batches: Optional[int] = None,
+            stop_event: Optional[threading.Event] = None) -> dict:
+        """이벤트를 계속 전달 - 밀린 이벤트가 있으면 대기 없이 다음 배치 처리"""
+        totals = {"batches": 0, "delivered": 0, "failed_posts": 0, "dead_lettered": 0}
+        while max_batches is None or totals["batches"] < max_batches:
+            if stop_event is not None and stop_event.is_set():
+                break
+            try:
+                stats = self.dispatch_once()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"아웃박스 디스패치 오류: {e}")
+                stats = {"fetched": 0, "delivered": 0, "failed_posts": 0, "dead_lettered": 0}
+
+            totals["batches"] += 1
+            for name in ("delivered", "failed_posts", "dead_lettered"):
+                totals[name] += stats[name]
+            if stats["delivered"]:
+                logger.info(f"아웃박스 전달 - {stats}")
+
+            # 배치가 가득 찼으면 밀린 이벤트가 더 있으므로 바로 이어서 처리
+            # (실패한 게시글은 재시도 시각까지 조회에서 빠지므로 대기할 필요 없음)
+            if stats["fetched"] < self.batch_size:
+                if stop_event is not None:
+                    stop_event.wait(poll_interval)
+                else:
+                    time.sleep(poll_interval)
+        return totals
+
+
+# ============================================================================
+# 지표 / 정리
+# ============================================================================
+
+def lag_metrics() -> dict:
+    """미발행 이벤트 수와 가장 오래된 미발행 이벤트의 지연 시간 (dead letter는 따로 집계)
+
+    dead letter 이벤트가 있는 게시글의 뒤 이벤트는 pending에 포함되며 되돌릴 때까지 전달되지 않습니다.
+    """
+    pending, oldest = db.session.execute(
+        select(func.count(OutboxEvent.id), func.min(OutboxEvent.created_at))
+        .where(OutboxEvent.dispatched_at.is_(None), OutboxEvent.failed_at.is_(None))
+    ).one()
+    dead_lettered = db.session.execute(
+        select(func.count(OutboxEvent.id)).where(OutboxEvent.failed_at.isnot(None))
+    ).scalar()
+    last_dispatched_id = db.session.execute(
+        select(func.max(OutboxEvent.id)).where(OutboxEvent.dispatched_at.isnot(None))
+    ).scalar()
+    lag_seconds = (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+    return {
+        "pending": pending,
+        "oldest_pending_at": oldest.isoformat() if oldest else None,
+        "lag_seconds": round(max(lag_seconds, 0.0), 3),
+        "last_dispatched_id": last_dispatched_id,
+        "dead_lettered": dead_lettered
+    }
+
+
+def requeue_failed(post_id: Optional[str] = None) -> int:
+    """dead letter 이벤트를 다시 전달 대상으로 되돌림 (싱크 장애 복구 후 사용) - 되돌린 건수 반환"""
+    stmt = update(OutboxEvent).where(OutboxEvent.failed_at.isnot(None))
+    if post_id is not None:
+        stmt = stmt.where(OutboxEvent.post_id == str(post_id))
+    result = db.session.execute(
+        stmt.values(failed_at=None, next_attempt_at=None, attempts=0)
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+    logger.info(f"dead letter 이벤트 재전달 예약 - {result.rowcount}건")
+    return result.rowcount
+
+
+def purge_dispatched(retention_days: int = 7, batch_size: int = 1000) -> dict:
+    """보존 기간이 지난 발행 완료 이벤트 삭제"""
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    stats = {"batches": 0, "events_purged": 0}
+
+    while True:
+        event_ids = db.session.execute(
+            select(OutboxEvent.id)
+            .where(OutboxEvent.dispatched_at.isnot(None), OutboxEvent.dispatched_at < cutoff)
+            .order_by(OutboxEvent.id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not event_ids:
+            break
+
+        db.session.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(event_ids)))
+        db.session.commit()
+        stats["batches"] += 1
+        stats["events_purged"] += len(event_ids)
+        if len(event_ids) < batch_size:
+            break
+
+    logger.info(f"발행 완료 이벤트 정리 - {stats}")
+    return stats
@@ -0,0 +1,65 @@
+"""
+Comment Service 커서(keyset) 페이지네이션 유틸리티
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, func, or_
+
+from .models import db
+
+
+def encode_cursor(values: List) -> str:
+    """정렬 키 값 목록을 불투명한 커서 문자열로 인코딩"""
+    normalized = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(normalized, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩 (형식이 잘못되면 ValueError)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def datetime_key(column):
+    """keyset 정렬/비교에 사용할 datetime 표현식
+
+    SQLite는 server_default(CURRENT_TIMESTAMP)와 SQLAlchemy 바인딩 값의 문자열 형식이 달라
+    그대로 비교하면 경계값이 어긋나므로 밀리초 단위 문자열로 정규화합니다.
+    """
+    if db.engine.dialect.name == "sqlite":
+        return func.strftime("%Y-%m-%d %H:%M:%f", column)
+    return column
+
+
+def datetime_from_cursor(value):
+    """커서에 저장된 datetime 키 값을 비교용 값으로 복원"""
+    if not isinstance(value, str):
+        raise ValueError("Invalid cursor")
+    if db.engine.dialect.name == "sqlite":
+        return value
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+
+
+def after_desc(columns: List, values: List):
+    """내림차순 복합 정렬 키에서 (values) 이후 행을 가리키는 WHERE 조건"""
+    clauses = []
+    for i, column in enumerate(columns):
+        equal_prefix = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal_prefix, column < values[i]))
+    return or_(*clauses)
@@ -0,0 +1,120 @@
+"""
+Comment Service best 정렬 점수
+좋아요 수에 작성 후 경과 시간 감쇠를 적용한 점수를 comments.score에 저장해 두고,
+(post_id, status, score, id) 인덱스 범위 스캔으로 best 정렬 페이지를 조회합니다.
+
+    score = (like_count + 1) / (min(age_hours, RANKING_DECAY_DAYS * 24) + 2) ^ GRAVITY
+
+- 좋아요가 바뀌면 해당 댓글 점수를 즉시 다시 계산합니다.
+- 시간 감쇠는 배치 작업(refresh_scores)이 최근 댓글을 대상으로 주기적으로 반영합니다.
+- 감쇠 기간(RANKING_DECAY_DAYS)이 지난 댓글은 배치가 더 이상 갱신하지 않으므로 경과 시간을 그 기간으로
+  고정합니다. 오래된 댓글에 좋아요가 눌려도 점수가 배치로 계산된 값보다 내려가지 않습니다.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from flask import current_app, has_app_context
+from sqlalchemy import bindparam, inspect, select, text, update
+
+from .models import db, Comment
+
+logger = logging.getLogger(__name__)
+
+GRAVITY = 1.5
+SCORE_INDEX = "ix_comments_post_status_score_id"
+DEFAULT_DECAY_DAYS = 7
+
+
+def decay_days() -> int:
+    """시간 감쇠를 반영하는 기간(일) - 앱 설정 RANKING_DECAY_DAYS"""
+    if has_app_context():
+        return current_app.config.get("RANKING_DECAY_DAYS", DEFAULT_DECAY_DAYS)
+    return DEFAULT_DECAY_DAYS
+
+
+def compute_score(like_count: int, created_at: Optional[datetime], now: Optional[datetime] = None,
+                  max_age_days: Optional[int] = None) -> float:
+    """좋아요 수와 작성 시각으로 best 점수 계산 (경과 시간은 감쇠 기간까지만 반영)"""
+    now = now or datetime.utcnow()
+    if max_age_days is None:
+        max_age_days = decay_days()
+    age_hours = max((now - created_at).total_seconds() / 3600.0, 0.0) if created_at else 0.0
+    age_hours = min(age_hours, max_age_days * 24.0)
+    return ((like_count or 0) + 1) / ((age_hours + 2) ** GRAVITY)
+
+
+def ensure_score_column() -> bool:
+    """기존 comments 테이블에 score 컬럼/인덱스가 없으면 추가하고 전체 점수를 채움 - 추가했으면 True
+
+    감쇠 배치는 최근 댓글만 갱신하므로, 채우지 않으면 기존 댓글은 score 0으로 남아 best 정렬이 id 순이 됩니다.
+    """
+    inspector = inspect(db.engine)
+    columns = {column["name"] for column in inspector.get_columns("comments")}
+    if "score" in columns:
+        return False
+
+    db.session.execute(text("ALTER TABLE comments ADD COLUMN score FLOAT NOT NULL DEFAULT 0"))
+    db.session.execute(text(
+        f"CREATE INDEX {SCORE_INDEX} ON comments (post_id, status, score, id)"
+    ))
+    db.session.commit()
+    logger.info("comments.score column added - backfilling scores")
+    # 배치마다 커밋하므로 중단되면 'flask comments refresh-scores --all'로 이어서 채울 수 있음
+    refresh_scores(max_age_days=None)
+    return True
+
+
+def refresh_scores(max_age_days: Optional[int] = 7, batch_size: int = 1000,
+                   sleep_seconds: float = 0.0) -> dict:
+    """점수에 시간 감쇠를 반영 - max_age_days 이내 작성된 보이는 댓글 대상 (None이면 전체)"""
+    comments = Comment.__table__
+    now = datetime.utcnow()
+    cap_days = decay_days()
+    stats = {"batches": 0, "comments_updated": 0, "elapsed_seconds": 0.0}
+    started = time.monotonic()
+    last_id = 0
+
+    # 감쇠 기간이 지난 댓글은 점수가 고정되므로 다시 계산하지 않음
+    # (하루 여유를 두어 기간을 막 넘긴 댓글도 고정 점수로 한 번 더 맞춰 둠)
+    conditions = [comments.c.status == "visible"]
+    if max_age_days is not None:
+        conditions.append(comments.c.created_at >= now - timedelta(days=max_age_days + 1))
+
+    update_stmt = (
+        update(comments)
+        .where(comments.c.id == bindparam("b_id"))
+        # 점수 갱신은 댓글 수정이 아니므로 updated_at(onupdate)을 그대로 유지
+        .values(score=bindparam("b_score"), updated_at=comments.c.updated_at)
+    )
+
+    while True:
+        rows = db.session.execute(
+            select(comments.c.id, comments.c.like_count, comments.c.created_at)
+            .where(*conditions, comments.c.id > last_id)
+            .order_by(comments.c.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        db.session.execute(update_stmt, [
+            {"b_id": row.id, "b_score": compute_score(row.like_count, row.created_at, now, cap_days)}
+            for row in rows
+        ])
+        db.session.commit()
+
+        last_id = rows[-1].id
+        stats["batches"] += 1
+        stats["comments_updated"] += len(rows)
+
+        if len(rows) < batch_size:
+            break
+        if sleep_seconds:
+            time.sleep(sleep_seconds)
+
+    stats["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    logger.info(f"best 점수 갱신 완료 - {stats}")
+    return stats
@@ -6,11 +6,19 @@ MSA 환경에서 독립적으로 동작하는 Comment 서비스 API입니다.
 import os
 import logging
 import jwt
+import httpx
 import requests
 import time
-from flask import Blueprint, request, jsonify, current_app
-from .models import db, Comment, CommentLike
+from flask import Blueprint, request, jsonify, current_app, stream_with_context
+from .models import db, Comment, CommentLike, CommentStatus
 from .services import CommentService
+from .async_services import AsyncCommentService
+from .search import MAX_PAGE_SIZE as MAX_SEARCH_SIZE
+from .ingest import ingest_comments, iter_ndjson
+from . import idempotency
+from .outbox import lag_metrics
+from .stream import format_sse, get_hub, is_public_event
+from . import export
 from datetime import datetime
 from functools import wraps
 
@@ -104,6 +112,38 @@ def get_public_keys_from_issuer(issuer: str) -> dict:
         logger.error(f"issuer 기반 공개키 가져오기 실패: {e}")
         return None
 
+async def get_cognito_public_keys_async():
+    """get_cognito_public_keys의 비동기 버전 - 같은 캐시를 사용하고 조회 중 이벤트 루프를 막지 않습니다."""
+    global _public_keys_cache, _public_keys_cache_time
+    
+    current_time = time.time()
+    
+    if _public_keys_cache and (current_time - _public_keys_cache_time) < _CACHE_DURATION:
+        return _public_keys_cache
+    
+    try:
+        url = f"https://cognito-idp.{COGNITO_REGION}.amazonaws.com/{COGNITO_USER_POOL_ID}/.well-known/jwks.json"
+        # 요청마다 이벤트 루프가 달라지므로 클라이언트는 조회할 때만 생성 (캐시 만료 시 1회)
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(url)
+        response.raise_for_status()
+        
+        # 캐시 업데이트
+        _public_keys_cache = response.json()
+        _public_keys_cache_time = current_time
+        
+        return _public_keys_cache
+    except httpx.HTTPError as e:
+        logger.error(f"공개키 가져오기 실패: {e}")
+        # 캐시된 공개키가 있으면 사용
+        if _public_keys_cache:
+            logger.info("캐시된 공개키 사용")
+            return _public_keys_cache
+        raise Exception("Failed to get public keys")
+    except Exception as e:
+        logger.error(f"공개키 가져오기 실패: {e}")
+        raise Exception("Failed to get public keys")
+
 def verify_cognito_token(token: str) -> dict:
     """Cognito JWT 토큰을 검증합니다.
 
@@ -245,6 +285,29 @@ def verify_cognito_token(token: str) -> dict:
         logger.error(f"에러 상세: {str(e)}")
         raise Exception("Token verification failed")
 
+async def verify_cognito_token_async(token: str) -> dict:
+    """공개키를 비동기로 받아 캐시에 둔 뒤 verify_cognito_token으로 검증합니다.
+
+    kid가 캐시에 없어 issuer JWKS를 다시 조회하는 드문 경우는 동기 경로를 그대로 사용합니다.
+    """
+    await get_cognito_public_keys_async()
+    return verify_cognito_token(token)
+
+def token_error_response(e: Exception):
+    """토큰 검증 예외를 401 응답으로 변환"""
+    logger.error(f"JWT validation failed: {str(e)}")
+    # 더 구체적인 에러 메시지 제공
+    if "Token expired" in str(e):
+        return api_error("Token expired", 401)
+    elif "Invalid audience" in str(e):
+        return api_error("Invalid token audience", 401)
+    elif "Invalid issuer" in str(e):
+        return api_error("Invalid token issuer", 401)
+    elif "Invalid token" in str(e):
+        return api_error("Invalid token format", 401)
+    else:
+        return api_error("Token verification failed", 401)
+
 def jwt_required(f):
     """JWT 토큰 검증 데코레이터"""
     @wraps(f)
@@ -264,21 +327,115 @@ def jwt_required(f):
             logger.info(f"JWT validation successful for user: {payload.get('sub', 'unknown')}")
             return f(*args, **kwargs)
         except Exception as e:
-            logger.error(f"JWT validation failed: {str(e)}")
-            # 더 구체적인 에러 메시지 제공
-            if "Token expired" in str(e):
-                return api_error("Token expired", 401)
-            elif "Invalid audience" in str(e):
-                return api_error("Invalid token audience", 401)
-            elif "Invalid issuer" in str(e):
-                return api_error("Invalid token issuer", 401)
-            elif "Invalid token" in str(e):
-                return api_error("Invalid token format", 401)
-            else:
-                return api_error("Token verification failed", 401)
+            return token_error_response(e)
+    
+    return decorated_function
+
+def async_jwt_required(f):
+    """async 뷰용 JWT 토큰 검증 데코레이터"""
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        token = request.headers.get('Authorization')
+        
+        if not token or not token.startswith('Bearer '):
+            logger.warning("Authorization header missing or invalid format")
+            return api_error("Authorization token required", 401)
+        
+        token = token.split(' ')[1]
+        
+        try:
+            payload = await verify_cognito_token_async(token)
+        except Exception as e:
+            return token_error_response(e)
+        
+        request.current_user = payload
+        logger.info(f"JWT validation successful for user: {payload.get('sub', 'unknown')}")
+        return await f(*args, **kwargs)
+    
+    return decorated_function
+
+def admin_required(f):
+    """관리자 그룹 확인 데코레이터 (jwt_required 뒤에 적용)"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        groups = request.current_user.get("cognito:groups") or []
+        if current_app.config.get("ADMIN_GROUP", "admin") not in groups:
+            logger.warning(f"관리자 권한 없음 - user: {request.current_user.get('sub', 'unknown')}")
+            return api_error("관리자 권한이 필요합니다", 403)
+        return f(*args, **kwargs)
+    
+    return decorated_function
+
+def idempotent(f):
+    """Idempotency-Key 헤더 처리 데코레이터 (jwt_required 뒤에 적용)
+
+    같은 사용자가 같은 키로 재요청하면 저장된 응답을 재실행 없이 반환합니다.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = request.headers.get('Idempotency-Key')
+        if not key:
+            return f(*args, **kwargs)
+        if len(key) > idempotency.MAX_KEY_LENGTH:
+            return api_error("Idempotency-Key가 너무 깁니다", 400)
+        
+        user_sub = request.current_user.get("sub")
+        fingerprint = idempotency.request_fingerprint(request.method, request.path, request.get_data())
+        state, record = idempotency.begin(
+            user_sub, key, fingerprint, current_app.config.get("IDEMPOTENCY_TTL_SECONDS", 86400),
+            lock_seconds=current_app.config.get("IDEMPOTENCY_LOCK_SECONDS", idempotency.DEFAULT_LOCK_SECONDS)
+        )
+        
+        if state == idempotency.MISMATCH:
+            return api_error("같은 Idempotency-Key로 다른 요청을 보낼 수 없습니다", 422)
+        if state == idempotency.IN_PROGRESS:
+            return api_error("같은 Idempotency-Key의 요청이 처리 중입니다", 409)
+        if state == idempotency.REPLAY:
+            logger.info(f"Idempotency-Key 재요청 - 저장된 응답 반환 (user: {user_sub})")
+            response = current_app.response_class(
+                record.response_body, status=record.status_code, mimetype='application/json'
+            )
+            response.headers['Idempotent-Replayed'] = 'true'
+            return response
+        
+        record_id, lock_token = record.id, record.lock_token
+        try:
+            response = current_app.make_response(f(*args, **kwargs))
+        except Exception:
+            idempotency.release(record_id, lock_token)
+            raise
+        
+        # 5xx 응답은 저장하지 않아 클라이언트가 같은 키로 재시도할 수 있게 함
+        if response.status_code >= 500:
+            idempotency.release(record_id, lock_token)
+        else:
+            idempotency.complete(record_id, response.status_code, response.get_data(as_text=True), lock_token)
+        return response
     
     return decorated_function
 
+def export_response(filename: str, post_id=None, user_id=None, include_hidden=False):
+    """댓글 내보내기 스트리밍 응답 생성 (format=ndjson|csv, gzip=1)"""
+    fmt = request.args.get('format', 'ndjson')
+    if fmt not in export.FORMATS:
+        return api_error("format은 ndjson 또는 csv만 가능합니다", 400)
+    use_gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    
+    rows = export.iter_comment_rows(post_id=post_id, user_id=user_id, include_hidden=include_hidden)
+    filename = f"{filename}.{fmt}" + (".gz" if use_gzip else "")
+    if use_gzip:
+        mimetype = 'application/gzip'
+    elif fmt == 'csv':
+        mimetype = 'text/csv'
+    else:
+        mimetype = 'application/x-ndjson'
+    
+    return current_app.response_class(
+        stream_with_context(export.iter_export(rows, fmt=fmt, gzip=use_gzip)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
 # ============================================================================
 # 댓글 API 엔드포인트
 # ============================================================================
@@ -316,8 +473,123 @@ def get_comments(post_id):
         logger.error(f"댓글 목록 조회 실패: {e}")
         return api_error("댓글 목록 조회에 실패했습니다", 500)
 
+@bp.route('/comments/search', methods=['GET'])
+@bp.route('/posts/<post_id>/comments/search', methods=['GET'])
+def search_comments(post_id=None):
+    """댓글 본문 검색 (게시글 또는 사용자 범위)"""
+    query = (request.args.get('q') or '').strip()
+    post_id = post_id or request.args.get('post_id')
+    user_id = request.args.get('user_id')
+    logger.info(f"댓글 검색 요청 - post_id: {post_id}, user_id: {user_id}")
+
+    if not query:
+        return api_error("검색어는 필수입니다", 400)
+    if not post_id and not user_id:
+        return api_error("post_id 또는 user_id 중 하나는 필수입니다", 400)
+
+    sort = request.args.get('sort', 'relevance')
+    if sort not in ('relevance', 'recent'):
+        return api_error("sort는 relevance 또는 recent만 가능합니다", 400)
+
+    try:
+        size = min(int(request.args.get('size', 20)), MAX_SEARCH_SIZE)
+        if size < 1:
+            return api_error("size는 1 이상이어야 합니다", 400)
+
+        comments, next_cursor = CommentService.search_comments(
+            query, post_id=post_id, user_id=user_id, sort=sort,
+            cursor=request.args.get('cursor'), limit=size
+        )
+
+        return api_response(data={
+            "comments": [comment.to_dict() for comment in comments],
+            "next_cursor": next_cursor,
+            "size": size
+        })
+
+    except ValueError:
+        return api_error("잘못된 페이지 요청입니다", 400)
+    except Exception as e:
+        logger.error(f"댓글 검색 실패: {e}")
+        return api_error("댓글 검색에 실패했습니다", 500)
+
+@bp.route('/posts/<post_id>/comments/stream', methods=['GET'])
+def stream_comments(post_id):
+    """게시글의 새 댓글/수정/삭제 이벤트 스트림 (Server-Sent Events)
+
+    재연결 시 Last-Event-ID 헤더(또는 last_event_id 파라미터) 이후의 이벤트를 먼저 보냅니다.
+    놓친 이벤트가 너무 많거나 버퍼가 넘치면 reset 이벤트를 보내며, 클라이언트는 목록을 다시 조회해야 합니다.
+    """
+    hub = get_hub()
+    if hub is None:
+        return api_error("댓글 스트림을 사용할 수 없습니다", 503)
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    try:
+        last_event_id = int(last_event_id) if last_event_id else None
+    except ValueError:
+        return api_error("잘못된 Last-Event-ID입니다", 400)
+    
+    config = current_app.config
+    heartbeat = config.get('STREAM_HEARTBEAT_SECONDS', 15)
+    max_seconds = config.get('STREAM_MAX_SECONDS', 300)
+    replay_limit = config.get('STREAM_REPLAY_LIMIT', 200)
+    retry_ms = config.get('STREAM_RETRY_MS', 3000)
+    
+    subscription = None
+    try:
+        # 재전송 조회보다 먼저 구독해야 그 사이의 이벤트를 놓치지 않음
+        subscription = hub.subscribe(post_id)
+        replay = []
+        reset = False
+        if last_event_id is not None:
+            replay = hub.backend.fetch_post(post_id, last_event_id, replay_limit + 1)
+            if len(replay) > replay_limit:
+                replay, reset = [], True
+            replay = [event for event in replay if is_public_event(event)]
+    except Exception as e:
+        # 재전송 조회가 실패해도 응답 제너레이터가 만들어지지 않으므로 여기서 구독 해제
+        if subscription is not None:
+            hub.unsubscribe(subscription)
+        logger.error(f"댓글 스트림 시작 실패: {e}")
+        return api_error("댓글 스트림 시작에 실패했습니다", 500)
+    
+    logger.info(f"댓글 스트림 연결 - post_id: {post_id}, last_event_id: {last_event_id}")
+    
+    def generate():
+        # 응답 생성 중에는 앱 컨텍스트/DB 세션을 사용하지 않음 (대기 중인 연결이 DB 연결을 잡지 않도록)
+        sent_ids = set()
+        try:
+            yield f"retry: {retry_ms}\n\n"
+            if reset:
+                yield "event: reset\ndata: {}\n\n"
+            for event in replay:
+                sent_ids.add(event["id"])
+                yield format_sse(event)
+            
+            deadline = time.monotonic() + max_seconds
+            while time.monotonic() < deadline:
+                events = subscription.get(timeout=heartbeat)
+                if subscription.take_overflow():
+                    yield "event: reset\ndata: {}\n\n"
+                if not events:
+                    yield ": heartbeat\n\n"
+                    continue
+                for event in events:
+                    if event["id"] in sent_ids:
+                        continue
+                    yield format_sse(event)
+        finally:
+            hub.unsubscribe(subscription)
+    
+    return current_app.response_class(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @bp.route('/posts/<post_id>/comments', methods=['POST'])
 @jwt_required
+@idempotent
 def create_comment(post_id):
     """댓글 작성"""
     logger.info(f"댓글 작성 요청 - post_id: {post_id}, type: {type(post_id)}")
@@ -443,22 +715,54 @@ def get_my_comments():
         
         page = int(request.args.get('page', 1))
         size = int(request.args.get('size', 10))
+        cursor = request.args.get('cursor')
         
         skip = (page - 1) * size
         
-        comments = CommentService.get_comments_by_user(user_sub, skip=skip, limit=size)
+        # cursor가 있으면 keyset 페이지네이션, 없으면 page 기반 (하위 호환)
+        comments, next_cursor = CommentService.get_comments_by_user(
+            user_sub, skip=skip, limit=size, cursor=cursor
+        )
+        total = CommentService.get_user_comment_count(user_sub)
         
         # 댓글을 딕셔너리로 변환
         comments_data = [comment.to_dict() for comment in comments]
         
-        return api_response(data=comments_data)
+        data = {
+            "comments": comments_data,
+            "total": total,
+            "page": page,
+            "size": size,
+            "next_cursor": next_cursor
+        }
         
+        # include=posts: 게시글 메타데이터를 한 번에 조회할 수 있도록 페이지의 post_id 목록 포함
+        if 'posts' in request.args.get('include', '').split(','):
+            data["post_ids"] = list(dict.fromkeys(comment.post_id for comment in comments))
+        
+        return api_response(data=data)
+        
+    except ValueError:
+        return api_error("잘못된 페이지 요청입니다", 400)
     except Exception as e:
         logger.error(f"내 댓글 목록 조회 실패: {e}")
         return api_error("내 댓글 목록 조회에 실패했습니다", 500)
 
+@bp.route('/comments/my/export', methods=['GET'])
+@jwt_required
+def export_my_comments():
+    """내 댓글 전체 내보내기 (숨김/삭제 포함, 개인정보 열람 요청용)"""
+    user_sub = request.current_user.get("sub")
+    if not user_sub:
+        logger.error(f"사용자 sub 정보가 없음: {request.current_user}")
+        return api_error("사용자 정보를 확인할 수 없습니다", 400)
+    
+    logger.info(f"내 댓글 내보내기 - user: {user_sub}")
+    return export_response("my-comments", user_id=user_sub, include_hidden=True)
+
 @bp.route('/comments/<int:comment_id>/like', methods=['POST'])
 @jwt_required
+@idempotent
 def toggle_comment_like(comment_id):
     """댓글 좋아요 토글"""
     try:
@@ -492,6 +796,42 @@ def toggle_comment_like(comment_id):
         logger.error(f"댓글 좋아요 토글 실패: {e}")
         return api_error("댓글 좋아요 토글에 실패했습니다", 500)
 
+@bp.route('/comments/<int:comment_id>/like', methods=['PUT', 'DELETE'])
+@jwt_required
+def set_comment_like(comment_id):
+    """댓글 좋아요 설정(PUT)/취소(DELETE) - 토글과 달리 반복 호출해도 결과가 같음"""
+    try:
+        # Cognito 사용자 정보 추출 및 검증
+        current_user = request.current_user
+        user_sub = current_user.get("sub")
+        
+        if not user_sub:
+            logger.error(f"사용자 sub 정보가 없음: {current_user}")
+            return api_error("사용자 정보를 확인할 수 없습니다", 400)
+        
+        # 댓글 존재 확인
+        comment = CommentService.get_comment_by_id(comment_id)
+        if not comment:
+            return api_error("댓글을 찾을 수 없습니다", 404)
+        
+        liked = request.method == 'PUT'
+        changed = CommentService.set_comment_like(comment_id, user_sub, liked)
+        
+        if liked:
+            message = "댓글에 좋아요를 눌렀습니다"
+        else:
+            message = "댓글 좋아요를 취소했습니다"
+        
+        return api_response(data={
+            "comment_id": comment_id,
+            "liked": liked,
+            "changed": changed
+        }, message=message)
+        
+    except Exception as e:
+        logger.error(f"댓글 좋아요 설정 실패: {e}")
+        return api_error("댓글 좋아요 설정에 실패했습니다", 500)
+
 @bp.route('/comments/<int:comment_id>/like/status', methods=['GET'])
 @jwt_required
 def get_comment_like_status(comment_id):
@@ -515,3 +855,207 @@ def get_comment_like_status(comment_id):
     except Exception as e:
         logger.error(f"댓글 좋아요 상태 확인 실패: {e}")
         return api_error("댓글 좋아요 상태 확인에 실패했습니다", 500)
+
+
+# ============================================================================
+# 관리자 API 엔드포인트
+# ============================================================================
+
+@bp.route('/admin/comments/status', methods=['POST'])
+@jwt_required
+@admin_required
+def bulk_update_comment_status():
+    """댓글 상태 일괄 변경 (스팸 정리 등)"""
+    data = request.get_json(silent=True) or {}
+    status = data.get('status')
+    comment_ids = data.get('comment_ids')
+    post_id = data.get('post_id')
+    user_id = data.get('user_id')
+    
+    if status not in [s.value for s in CommentStatus]:
+        return api_error("status는 visible, hidden, deleted 중 하나여야 합니다", 400)
+    if comment_ids is not None:
+        if not isinstance(comment_ids, list) or not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in comment_ids
+        ):
+            return api_error("comment_ids는 정수 목록이어야 합니다", 400)
+    elif not (post_id and user_id):
+        return api_error("comment_ids 또는 post_id와 user_id가 필요합니다", 400)
+    
+    try:
+        result = CommentService.bulk_update_status(
+            status, comment_ids=comment_ids, post_id=post_id, user_id=user_id
+        )
+        
+        logger.info(f"댓글 상태 일괄 변경 - by: {request.current_user.get('sub')}, result: {result}")
+        return api_response(data=result, message="댓글 상태가 변경되었습니다")
+        
+    except Exception as e:
+        logger.error(f"댓글 상태 일괄 변경 실패: {e}")
+        return api_error("댓글 상태 일괄 변경에 실패했습니다", 500)
+
+@bp.route('/admin/outbox/metrics', methods=['GET'])
+@jwt_required
+@admin_required
+def get_outbox_metrics():
+    """이벤트 아웃박스 발행 지연 지표"""
+    try:
+        return api_response(data=lag_metrics())
+    except Exception as e:
+        logger.error(f"아웃박스 지표 조회 실패: {e}")
+        return api_error("아웃박스 지표 조회에 실패했습니다", 500)
+
+@bp.route('/admin/posts/<post_id>/comments/export', methods=['GET'])
+@jwt_required
+@admin_required
+def export_post_comments(post_id):
+    """게시글 댓글 전체 내보내기 (include_hidden=1이면 숨김/삭제 포함)"""
+    include_hidden = request.args.get('include_hidden', '').lower() in ('1', 'true', 'yes')
+    logger.info(f"게시글 댓글 내보내기 - post_id: {post_id}, by: {request.current_user.get('sub')}")
+    return export_response(f"post-{post_id}-comments", post_id=post_id, include_hidden=include_hidden)
+
+@bp.route('/admin/comments/import', methods=['POST'])
+@jwt_required
+@admin_required
+def import_comments():
+    """댓글 대량 적재 (NDJSON 스트리밍 또는 JSON 배열)"""
+    try:
+        if request.mimetype == 'application/json':
+            data = request.get_json(silent=True)
+            if not isinstance(data, list):
+                return api_error("JSON 배열 또는 NDJSON 본문이 필요합니다", 400)
+            records = enumerate(data, start=1)
+        else:
+            # application/x-ndjson 본문은 메모리에 올리지 않고 줄 단위로 처리
+            records = iter_ndjson(request.stream)
+        
+        stats = ingest_comments(records)
+        
+        logger.info(f"댓글 대량 적재 - by: {request.current_user.get('sub')}, "
+                    f"inserted: {stats['inserted']}, rejected: {stats['rejected']}")
+        return api_response(data=stats, message="댓글 적재가 완료되었습니다", status_code=201)
+        
+    except Exception as e:
+        logger.error(f"댓글 대량 적재 실패: {e}")
+        return api_error("댓글 대량 적재에 실패했습니다", 500)
+
+# ============================================================================
+# async 조회 뷰 (ASYNC_VIEWS_ENABLED일 때 같은 엔드포인트를 대체)
+# ============================================================================
+# Flask(WSGI)는 async 뷰마다 새 이벤트 루프를 만들고 비동기 엔진은 NullPool이라 요청마다 연결을 새로 엽니다.
+# 기본은 위의 동기 뷰(풀링된 동기 엔진)를 사용하며, 긴 수명의 이벤트 루프를 쓰는 ASGI 서버로 옮길 때 켭니다.
+
+async def get_comments_async(post_id):
+    """특정 게시글의 댓글 목록 조회 (async)"""
+    logger.info(f"댓글 목록 조회 요청 - post_id: {post_id}, type: {type(post_id)}")
+    
+    try:
+        page = int(request.args.get('page', 1))
+        size = int(request.args.get('size', 10))
+        sort_by = request.args.get('sort_by', 'created_at')
+        sort_order = request.args.get('sort_order', 'desc')
+        
+        skip = (page - 1) * size
+        
+        comments, total = await AsyncCommentService.get_comments(
+            post_id, skip=skip, limit=size,
+            sort_by=sort_by, sort_order=sort_order
+        )
+        
+        # 댓글을 딕셔너리로 변환
+        comments_data = [comment.to_dict() for comment in comments]
+        
+        logger.info(f"댓글 목록 조회 성공 - count: {len(comments_data)}, total: {total}")
+        return api_response(data={
+            "comments": comments_data,
+            "total": total,
+            "page": page,
+            "size": size
+        })
+        
+    except Exception as e:
+        logger.error(f"댓글 목록 조회 실패: {e}")
+        return api_error("댓글 목록 조회에 실패했습니다", 500)
+
+@async_jwt_required
+async def get_my_comments_async():
+    """내 댓글 목록 조회 (async)"""
+    try:
+        # Cognito 사용자 정보 추출 및 검증
+        current_user = request.current_user
+        user_sub = current_user.get("sub")
+        
+        if not user_sub:
+            logger.error(f"사용자 sub 정보가 없음: {current_user}")
+            return api_error("사용자 정보를 확인할 수 없습니다", 400)
+        
+        page = int(request.args.get('page', 1))
+        size = int(request.args.get('size', 10))
+        cursor = request.args.get('cursor')
+        
+        skip = (page - 1) * size
+        
+        # cursor가 있으면 keyset 페이지네이션, 없으면 page 기반 (하위 호환)
+        comments, next_cursor, total = await AsyncCommentService.get_user_comments_page(
+            user_sub, skip=skip, limit=size, cursor=cursor
+        )
+        
+        # 댓글을 딕셔너리로 변환
+        comments_data = [comment.to_dict() for comment in comments]
+        
+        data = {
+            "comments": comments_data,
+            "total": total,
+            "page": page,
+            "size": size,
+            "next_cursor": next_cursor
+        }
+        
+        # include=posts: 게시글 메타데이터를 한 번에 조회할 수 있도록 페이지의 post_id 목록 포함
+        if 'posts' in request.args.get('include', '').split(','):
+            data["post_ids"] = list(dict.fromkeys(comment.post_id for comment in comments))
+        
+        return api_response(data=data)
+        
+    except ValueError:
+        return api_error("잘못된 페이지 요청입니다", 400)
+    except Exception as e:
+        logger.error(f"내 댓글 목록 조회 실패: {e}")
+        return api_error("내 댓글 목록 조회에 실패했습니다", 500)
+
+@async_jwt_required
+async def get_comment_like_status_async(comment_id):
+    """댓글 좋아요 상태 확인 (async)"""
+    try:
+        # Cognito 사용자 정보 추출 및 검증
+        current_user = request.current_user
+        user_sub = current_user.get("sub")
+        
+        if not user_sub:
+            logger.error(f"사용자 sub 정보가 없음: {current_user}")
+            return api_error("사용자 정보를 확인할 수 없습니다", 400)
+        
+        is_liked = await AsyncCommentService.get_comment_like_status(comment_id, user_sub)
+        
+        return api_response(data={
+            "comment_id": comment_id,
+            "is_liked": is_liked
+        })
+        
+    except Exception as e:
+        logger.error(f"댓글 좋아요 상태 확인 실패: {e}")
+        return api_error("댓글 좋아요 상태 확인에 실패했습니다", 500)
+
+
+ASYNC_VIEWS = {
+    "get_comments": get_comments_async,
+    "get_my_comments": get_my_comments_async,
+    "get_comment_like_status": get_comment_like_status_async,
+}
+
+
+def enable_async_views(app):
+    """동기 조회 뷰를 async 뷰로 교체 (블루프린트 등록 후 호출)"""
+    for endpoint, view in ASYNC_VIEWS.items():
+        app.view_functions[f"{bp.name}.{endpoint}"] = view
+    logger.info(f"async 조회 뷰 사용 - {', '.join(ASYNC_VIEWS)}")
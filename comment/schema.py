@@ -0,0 +1,81 @@
+"""
+Comment Service 기존 DB 스키마 보강
+db.create_all()은 이미 있는 테이블에 인덱스를 추가하지 않으므로,
+모델에 선언된 인덱스 중 DB에 없는 것을 시작 시 생성합니다.
+"""
+
+import logging
+
+from sqlalchemy import bindparam, case, delete, func, inspect, select, text, update
+
+from .models import db, Comment, CommentLike
+
+logger = logging.getLogger(__name__)
+
+
+def has_index(table_name: str, name: str) -> bool:
+    """인덱스 또는 같은 이름의 유니크 제약이 있는지 확인"""
+    inspector = inspect(db.engine)
+    names = {index["name"] for index in inspector.get_indexes(table_name)}
+    names.update(constraint["name"] for constraint in inspector.get_unique_constraints(table_name))
+    return name in names
+
+
+def ensure_index(table, name: str) -> bool:
+    """모델에 선언된 인덱스가 DB에 없으면 생성 - 생성했으면 True"""
+    if has_index(table.name, name):
+        return False
+
+    index = next(index for index in table.indexes if index.name == name)
+    index.create(bind=db.engine)
+    logger.info(f"index {name} created on {table.name}")
+    return True
+
+
+def ensure_columns(table, columns: dict) -> bool:
+    """{컬럼명: DDL 타입} 중 DB에 없는 컬럼을 추가 - 추가했으면 True"""
+    existing = {column["name"] for column in inspect(db.engine).get_columns(table.name)}
+    missing = [name for name in columns if name not in existing]
+    for name in missing:
+        db.session.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {columns[name]}"))
+        logger.info(f"column {name} added to {table.name}")
+    db.session.commit()
+    return bool(missing)
+
+
+def ensure_like_unique_index() -> bool:
+    """comment_likes (comment_id, user_id) 유니크 인덱스 추가 - 기존 중복 좋아요는 가장 먼저 생긴 것만 남김"""
+    likes = CommentLike.__table__
+    if has_index(likes.name, "uq_comment_likes_comment_user"):
+        return False
+
+    duplicates = db.session.execute(
+        select(likes.c.comment_id, likes.c.user_id, func.min(likes.c.id).label("keep_id"))
+        .group_by(likes.c.comment_id, likes.c.user_id)
+        .having(func.count() > 1)
+    ).all()
+    if duplicates:
+        removed = {}
+        for row in duplicates:
+            result = db.session.execute(
+                delete(likes).where(
+                    likes.c.comment_id == row.comment_id,
+                    likes.c.user_id == row.user_id,
+                    likes.c.id != row.keep_id
+                )
+            )
+            removed[row.comment_id] = removed.get(row.comment_id, 0) + result.rowcount
+
+        # 중복으로 늘어난 like_count만 되돌림 (적재된 댓글은 좋아요 행 없이 like_count를 가질 수 있음)
+        comments = Comment.__table__
+        new_count = comments.c.like_count - bindparam("b_removed")
+        db.session.execute(
+            update(comments)
+            .where(comments.c.id == bindparam("b_id"))
+            .values(like_count=case((new_count < 0, 0), else_=new_count), updated_at=comments.c.updated_at),
+            [{"b_id": comment_id, "b_removed": count} for comment_id, count in removed.items()]
+        )
+        db.session.commit()
+        logger.info(f"duplicate likes removed - {sum(removed.values())} rows on {len(removed)} comments")
+
+    return ensure_index(likes, "uq_comment_likes_comment_user")
@@ -0,0 +1,204 @@
+"""
+Comment Service 전문 검색(Full-text search)
+MySQL은 FULLTEXT(ngram) 인덱스, SQLite는 FTS5 가상 테이블을 사용하고
+둘 다 사용할 수 없으면 LIKE 검색으로 대체합니다.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import bindparam, column, literal_column, select, table, text
+from sqlalchemy.dialects.mysql import match as mysql_match
+
+from .models import db, Comment
+from .pagination import after_desc, datetime_from_cursor, datetime_key, decode_cursor, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "comments_fts"
+FULLTEXT_INDEX = "ix_comments_content_fulltext"
+MAX_PAGE_SIZE = 50
+
+BACKEND_MYSQL = "mysql"
+BACKEND_FTS5 = "fts5"
+BACKEND_LIKE = "like"
+
+SORT_RELEVANCE = "relevance"
+SORT_RECENT = "recent"
+
+
+def ensure_search_index() -> str:
+    """검색 인덱스를 생성(없을 때만)하고 사용할 검색 백엔드를 반환"""
+    dialect = db.engine.dialect.name
+    backend = BACKEND_LIKE
+
+    if dialect == "mysql":
+        exists = db.session.execute(
+            text("SHOW INDEX FROM comments WHERE Key_name = :name"),
+            {"name": FULLTEXT_INDEX}
+        ).first()
+        if not exists:
+            db.session.execute(text(
+                f"ALTER TABLE comments ADD FULLTEXT INDEX {FULLTEXT_INDEX} (content) WITH PARSER ngram"
+            ))
+            db.session.commit()
+            logger.info("FULLTEXT index created on comments.content")
+        backend = BACKEND_MYSQL
+    elif dialect == "sqlite":
+        try:
+            exists = db.session.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": FTS_TABLE}
+            ).first()
+            if not exists:
+                db.session.execute(text(f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(content)"))
+                # 기존 댓글 백필
+                db.session.execute(text(
+                    f"INSERT INTO {FTS_TABLE} (rowid, content) SELECT id, content FROM comments"
+                ))
+                db.session.commit()
+                logger.info("FTS5 table created for comments")
+            backend = BACKEND_FTS5
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"FTS5 unavailable, falling back to LIKE search: {e}")
+
+    current_app.extensions["comment_search"] = backend
+    return backend
+
+
+def get_backend() -> str:
+    """현재 앱에서 사용 중인 검색 백엔드"""
+    return current_app.extensions.get("comment_search", BACKEND_LIKE)
+
+
+# ============================================================================
+# 인덱스 동기화 - CommentService에서 커밋 전에 호출 (같은 트랜잭션)
+# ============================================================================
+
+def index_comment(comment_id: int, content: str) -> None:
+    """댓글을 검색 인덱스에 추가/갱신 (MySQL FULLTEXT는 자동 동기화)"""
+    if get_backend() != BACKEND_FTS5:
+        return
+    db.session.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": comment_id})
+    db.session.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, content) VALUES (:id, :content)"),
+        {"id": comment_id, "content": content}
+    )
+
+
+def remove_comment(comment_id: int) -> None:
+    """댓글을 검색 인덱스에서 제거"""
+    if get_backend() != BACKEND_FTS5:
+        return
+    db.session.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": comment_id})
+
+
+def index_comments(rows: List[Tuple[int, str]]) -> None:
+    """(id, content) 목록을 검색 인덱스에 일괄 추가 (신규 댓글 대량 적재용)"""
+    if get_backend() != BACKEND_FTS5 or not rows:
+        return
+    db.session.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, content) VALUES (:id, :content)"),
+        [{"id": comment_id, "content": content} for comment_id, content in rows]
+    )
+
+
+def reindex_comments(comment_ids: List[int]) -> None:
+    """여러 댓글을 검색 인덱스에 다시 반영 (일괄 상태 변경용)"""
+    if get_backend() != BACKEND_FTS5 or not comment_ids:
+        return
+    remove_comments(comment_ids)
+    db.session.execute(
+        text(f"INSERT INTO {FTS_TABLE} (rowid, content) SELECT id, content FROM comments WHERE id IN :ids")
+        .bindparams(bindparam("ids", expanding=True)),
+        {"ids": list(comment_ids)}
+    )
+
+
+def remove_comments(comment_ids: List[int]) -> None:
+    """여러 댓글을 검색 인덱스에서 제거"""
+    if get_backend() != BACKEND_FTS5 or not comment_ids:
+        return
+    db.session.execute(
+        text(f"DELETE FROM {FTS_TABLE} WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"ids": list(comment_ids)}
+    )
+
+
+# ============================================================================
+# 검색 쿼리
+# ============================================================================
+
+def _fts5_expression(query: str) -> str:
+    """사용자 입력을 FTS5 구문으로 변환 (각 단어를 구문 문자열로 감싸 AND 검색)"""
+    terms = query.split()
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _escape_like(query: str) -> str:
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search(query: str, post_id: Optional[str] = None, user_id: Optional[str] = None,
+           sort: str = SORT_RELEVANCE, cursor: Optional[str] = None,
+           limit: int = 20) -> Tuple[List[Comment], Optional[str]]:
+    """댓글 본문 검색 - keyset 페이지네이션 결과와 다음 커서를 반환"""
+    backend = get_backend()
+
+    if backend == BACKEND_MYSQL:
+        score = mysql_match(Comment.content, against=query).in_natural_language_mode()
+        stmt = select(Comment).where(score > 0)
+    elif backend == BACKEND_FTS5:
+        fts = table(FTS_TABLE, column("rowid"))
+        score = literal_column(f"-bm25({FTS_TABLE})")
+        stmt = (
+            select(Comment)
+            .select_from(fts)
+            .join(Comment, Comment.id == fts.c.rowid)
+            .where(text(f"{FTS_TABLE} MATCH :fts_query").bindparams(fts_query=_fts5_expression(query)))
+        )
+    else:
+        score = None
+        stmt = select(Comment).where(
+            Comment.content.like(f"%{_escape_like(query)}%", escape="\\")
+        )
+
+    stmt = stmt.where(Comment.status == "visible")
+    if post_id is not None:
+        stmt = stmt.where(Comment.post_id == post_id)
+    if user_id is not None:
+        stmt = stmt.where(Comment.user_id == user_id)
+
+    # LIKE 대체 검색에는 관련도 점수가 없으므로 최신순으로 처리
+    after = decode_cursor(cursor, 2)
+    try:
+        if sort == SORT_RELEVANCE and score is not None:
+            sort_key = score
+            if after:
+                after = [float(after[0]), int(after[1])]
+        else:
+            sort_key = datetime_key(Comment.created_at)
+            if after:
+                after = [datetime_from_cursor(after[0]), int(after[1])]
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+    stmt = stmt.add_columns(sort_key.label("sort_key"))
+    if after:
+        stmt = stmt.where(after_desc([sort_key, Comment.id], after))
+    stmt = stmt.order_by(sort_key.desc(), Comment.id.desc())
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    rows = db.session.execute(stmt.limit(limit + 1)).all()
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    comments = [row[0] for row in rows]
+    next_cursor = None
+    if has_next and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor([last.sort_key, last[0].id])
+
+    return comments, next_cursor
@@ -2,9 +2,16 @@
 Comment Service 비즈니스 로직
 """
 
-from .models import db, Comment, CommentLike
+from sqlalchemy import Select, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from .models import db, Comment, CommentLike, CommentStatus
+from . import counters, outbox, ranking, search
+from .dto import COMMENT_COLUMNS, CommentRecord
+from .pagination import after_desc, datetime_from_cursor, datetime_key, decode_cursor, encode_cursor
 from typing import List, Tuple, Optional
 
+BULK_CHUNK_SIZE = 500
+
 class CommentService:
     """댓글 서비스 클래스"""
     
@@ -15,54 +22,125 @@ class CommentService:
             post_id=post_id,
             user_id=user_id,
             user_name=user_name,
-            content=content
+            content=content,
+            score=ranking.compute_score(0, None)
         )
         db.session.add(comment)
+        db.session.flush()
+        search.index_comment(comment.id, content)
+        counters.adjust_user_counts({user_id: 1})
+        outbox.record(outbox.COMMENT_CREATED, post_id, {
+            "comment_id": comment.id,
+            "post_id": post_id,
+            "user_id": user_id,
+            "user_name": user_name,
+            "content": content
+        })
         db.session.commit()
         db.session.refresh(comment)
         return comment
     
     @staticmethod
-    def get_comment_by_id(comment_id: int) -> Optional[Comment]:
-        """ID로 댓글 조회"""
-        return Comment.query.get(comment_id)
+    def get_comment_by_id(comment_id: int) -> Optional[CommentRecord]:
+        """ID로 댓글 조회 (읽기 전용 레코드)"""
+        row = db.session.execute(
+            select(*COMMENT_COLUMNS).where(Comment.id == comment_id)
+        ).first()
+        return CommentRecord.from_row(row) if row else None
     
     @staticmethod
     def get_comments(post_id: int, skip: int = 0, limit: int = 10,
-                     sort_by: str = "created_at", sort_order: str = "desc") -> Tuple[List[Comment], int]:
+                     sort_by: str = "created_at", sort_order: str = "desc") -> Tuple[List[CommentRecord], int]:
         """특정 게시글의 댓글 목록 조회"""
-        query = Comment.query.filter_by(
-            post_id=post_id,
-            status="visible"
-        )
+        stmt, count_stmt = CommentService._comments_query(post_id, sort_by, sort_order)
+        
+        # 총 개수 계산
+        total = db.session.execute(count_stmt).scalar()
+        
+        # 페이지네이션
+        rows = db.session.execute(stmt.offset(skip).limit(limit)).all()
+        
+        return [CommentRecord.from_row(row) for row in rows], total
+    
+    @staticmethod
+    def _comments_query(post_id: int, sort_by: str, sort_order: str) -> Tuple[Select, Select]:
+        """게시글 댓글 목록/개수 조회문 생성 (동기/비동기 경로 공용)"""
+        conditions = [Comment.post_id == post_id, Comment.status == "visible"]
+        stmt = select(*COMMENT_COLUMNS).where(*conditions)
         
         # 정렬
         if sort_by == "created_at":
             if sort_order == "desc":
-                query = query.order_by(Comment.created_at.desc())
+                stmt = stmt.order_by(Comment.created_at.desc())
             else:
-                query = query.order_by(Comment.created_at.asc())
+                stmt = stmt.order_by(Comment.created_at.asc())
         elif sort_by == "like_count":
             if sort_order == "desc":
-                query = query.order_by(Comment.like_count.desc())
+                stmt = stmt.order_by(Comment.like_count.desc())
             else:
-                query = query.order_by(Comment.like_count.asc())
+                stmt = stmt.order_by(Comment.like_count.asc())
+        elif sort_by == "best":
+            # (post_id, status, score, id) 인덱스 범위 스캔
+            if sort_order == "desc":
+                stmt = stmt.order_by(Comment.score.desc(), Comment.id.desc())
+            else:
+                stmt = stmt.order_by(Comment.score.asc(), Comment.id.asc())
         
-        # 총 개수 계산
-        total = query.count()
+        return stmt, select(func.count(Comment.id)).where(*conditions)
+    
+    @staticmethod
+    def get_comments_by_user(user_id: str, skip: int = 0, limit: int = 10,
+                             cursor: Optional[str] = None) -> Tuple[List[CommentRecord], Optional[str]]:
+        """특정 사용자가 작성한 댓글 조회 (최신순, 커서가 있으면 keyset 페이지네이션)"""
+        stmt = CommentService._user_comments_query(user_id, skip, limit, cursor)
+        rows = db.session.execute(stmt).all()
+        return CommentService._user_comments_page(rows, limit)
+    
+    @staticmethod
+    def _user_comments_query(user_id: str, skip: int, limit: int, cursor: Optional[str]) -> Select:
+        """사용자 댓글 페이지 조회문 생성 - 다음 페이지 확인을 위해 limit + 1개 조회"""
+        sort_key = datetime_key(Comment.created_at)
+        stmt = (
+            select(*COMMENT_COLUMNS, sort_key.label("sort_key"))
+            .where(Comment.user_id == user_id, Comment.status == "visible")
+            .order_by(sort_key.desc(), Comment.id.desc())
+        )
         
-        # 페이지네이션
-        comments = query.offset(skip).limit(limit).all()
+        after = decode_cursor(cursor, 2)
+        if after:
+            try:
+                after = [datetime_from_cursor(after[0]), int(after[1])]
+            except (TypeError, ValueError):
+                raise ValueError("Invalid cursor")
+            stmt = stmt.where(after_desc([sort_key, Comment.id], after))
+        elif skip:
+            stmt = stmt.offset(skip)
         
-        return comments, total
+        return stmt.limit(limit + 1)
     
     @staticmethod
-    def get_comments_by_user(user_id: str, skip: int = 0, limit: int = 10) -> List[Comment]:
-        """특정 사용자가 작성한 댓글 조회"""
-        return Comment.query.filter_by(
-            user_id=user_id,
-            status="visible"
-        ).offset(skip).limit(limit).all()
+    def _user_comments_page(rows, limit: int) -> Tuple[List[CommentRecord], Optional[str]]:
+        """limit + 1개 조회 결과를 페이지와 다음 커서로 변환"""
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        
+        next_cursor = None
+        if has_next and rows:
+            next_cursor = encode_cursor([rows[-1].sort_key, rows[-1].id])
+        return [CommentRecord.from_row(row) for row in rows], next_cursor
+    
+    @staticmethod
+    def get_user_comment_count(user_id: str) -> int:
+        """사용자의 보이는 댓글 수 (캐시)"""
+        return counters.get_user_comment_count(user_id)
+    
+    @staticmethod
+    def search_comments(query: str, post_id: Optional[str] = None, user_id: Optional[str] = None,
+                        sort: str = "relevance", cursor: Optional[str] = None,
+                        limit: int = 20) -> Tuple[List[Comment], Optional[str]]:
+        """댓글 본문 전문 검색 (게시글/사용자 범위, 커서 페이지네이션)"""
+        return search.search(query, post_id=post_id, user_id=user_id,
+                             sort=sort, cursor=cursor, limit=limit)
     
     @staticmethod
     def update_comment(comment_id: int, update_data: dict) -> Optional[Comment]:
@@ -75,6 +153,15 @@ class CommentService:
             if hasattr(comment, key):
                 setattr(comment, key, value)
         
+        if "content" in update_data:
+            search.index_comment(comment.id, comment.content)
+        outbox.record(outbox.COMMENT_UPDATED, comment.post_id, {
+            "comment_id": comment.id,
+            "post_id": comment.post_id,
+            "user_id": comment.user_id,
+            "content": comment.content,
+            "status": comment.status.value
+        })
         db.session.commit()
         db.session.refresh(comment)
         return comment
@@ -86,36 +173,179 @@ class CommentService:
         if not comment:
             return False
         
+        if comment.status == CommentStatus.visible:
+            counters.adjust_user_counts({comment.user_id: -1})
         comment.status = "deleted"
+        search.remove_comment(comment.id)
+        outbox.record(outbox.COMMENT_DELETED, comment.post_id, {
+            "comment_id": comment.id,
+            "post_id": comment.post_id,
+            "user_id": comment.user_id
+        })
         db.session.commit()
         return True
     
+    @staticmethod
+    def _apply_status_chunk(targets: list, status: CommentStatus) -> int:
+        """댓글 묶음의 상태를 변경하고 검색 인덱스/이벤트를 같은 트랜잭션에서 갱신"""
+        comment_ids = [row.id for row in targets]
+        result = db.session.execute(
+            update(Comment)
+            .where(Comment.id.in_(comment_ids))
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if status == CommentStatus.visible:
+            search.reindex_comments(comment_ids)
+        elif status == CommentStatus.deleted:
+            search.remove_comments(comment_ids)
+        
+        # 보이는 댓글 수 캐시 증감
+        deltas = {}
+        for row in targets:
+            if status == CommentStatus.visible:
+                deltas[row.user_id] = deltas.get(row.user_id, 0) + 1
+            elif row.status == CommentStatus.visible:
+                deltas[row.user_id] = deltas.get(row.user_id, 0) - 1
+        counters.adjust_user_counts(deltas)
+        
+        outbox.record_many([
+            (outbox.COMMENT_STATUS_CHANGED, row.post_id, {
+                "comment_id": row.id,
+                "post_id": row.post_id,
+                "user_id": row.user_id,
+                "previous_status": row.status.value,
+                "status": status.value
+            })
+            for row in targets
+        ])
+        db.session.commit()
+        return result.rowcount
+    
+    @staticmethod
+    def bulk_update_status(status: str, comment_ids: Optional[List[int]] = None,
+                           post_id: Optional[str] = None, user_id: Optional[str] = None,
+                           chunk_size: int = BULK_CHUNK_SIZE) -> dict:
+        """댓글 상태 일괄 변경 (ID 목록 또는 게시글 내 특정 사용자의 전체 댓글)"""
+        status = CommentStatus(status)
+        matched = 0
+        affected = 0
+        
+        try:
+            if comment_ids is not None:
+                unique_ids = sorted(set(comment_ids))
+                for i in range(0, len(unique_ids), chunk_size):
+                    chunk = unique_ids[i:i + chunk_size]
+                    # 이미 같은 상태인 댓글은 제외하고 실제 변경 대상만 갱신
+                    targets = db.session.execute(
+                        select(Comment.id, Comment.post_id, Comment.user_id, Comment.status)
+                        .where(Comment.id.in_(chunk), Comment.status != status)
+                    ).all()
+                    matched += len(targets)
+                    if targets:
+                        affected += CommentService._apply_status_chunk(targets, status)
+            else:
+                while True:
+                    targets = db.session.execute(
+                        select(Comment.id, Comment.post_id, Comment.user_id, Comment.status)
+                        .where(Comment.post_id == post_id, Comment.user_id == user_id, Comment.status != status)
+                        .order_by(Comment.id)
+                        .limit(chunk_size)
+                    ).all()
+                    if not targets:
+                        break
+                    matched += len(targets)
+                    affected += CommentService._apply_status_chunk(targets, status)
+        except Exception:
+            db.session.rollback()
+            raise
+        
+        return {"status": status.value, "matched": matched, "affected": affected}
+    
+    @staticmethod
+    def _record_like_event(comment: Comment, user_id: str, liked: bool) -> None:
+        """좋아요 변경 이벤트 기록"""
+        outbox.record(outbox.COMMENT_LIKED if liked else outbox.COMMENT_UNLIKED, comment.post_id, {
+            "comment_id": comment.id,
+            "post_id": comment.post_id,
+            "user_id": user_id
+        })
+    
     @staticmethod
     def toggle_comment_like(comment_id: int, user_id: str) -> bool:
-        """댓글 좋아요 토글"""
+        """댓글 좋아요 토글 - 토글 후 좋아요 상태 반환"""
         # 기존 좋아요 확인
         existing_like = CommentLike.query.filter_by(
             comment_id=comment_id,
             user_id=user_id
         ).first()
         
-        if existing_like:
-            # 좋아요 취소
-            db.session.delete(existing_like)
-            comment = Comment.query.get(comment_id)
-            if comment and comment.like_count > 0:
-                comment.like_count -= 1
-            db.session.commit()
+        liked = existing_like is None
+        # 동시 요청이 먼저 같은 쪽으로 바꿨어도 결과 상태는 같음
+        CommentService._change_like(comment_id, user_id, liked, existing_like)
+        return liked
+    
+    @staticmethod
+    def set_comment_like(comment_id: int, user_id: str, liked: bool) -> bool:
+        """댓글 좋아요 설정/취소 (멱등) - 실제로 상태가 바뀌었으면 True"""
+        existing_like = CommentLike.query.filter_by(
+            comment_id=comment_id,
+            user_id=user_id
+        ).first()
+        
+        if liked == (existing_like is not None):
             return False
-        else:
-            # 좋아요 추가
-            new_like = CommentLike(comment_id=comment_id, user_id=user_id)
-            db.session.add(new_like)
-            comment = Comment.query.get(comment_id)
+        
+        return CommentService._change_like(comment_id, user_id, liked, existing_like)
+    
+    @staticmethod
+    def _change_like(comment_id: int, user_id: str, liked: bool,
+                     existing_like: Optional[CommentLike]) -> bool:
+        """좋아요 행 추가/삭제와 카운터 갱신 - 같은 사용자의 동시 요청이 먼저 반영했으면 False"""
+        comment = Comment.query.get(comment_id)
+        
+        try:
+            if liked:
+                db.session.add(CommentLike(comment_id=comment_id, user_id=user_id))
+                # 동시 요청과 중복이면 카운터를 바꾸기 전에 여기서 IntegrityError 발생
+                db.session.flush()
+                delta = 1
+            else:
+                deleted = db.session.execute(
+                    delete(CommentLike)
+                    .where(CommentLike.id == existing_like.id)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if not deleted:
+                    # 같은 사용자의 동시 요청이 먼저 좋아요를 취소함
+                    db.session.rollback()
+                    return False
+                delta = -1
+            
+            db.session.execute(
+                update(Comment)
+                .where(Comment.id == comment_id, Comment.like_count + delta >= 0)
+                .values(like_count=Comment.like_count + delta)
+                .execution_options(synchronize_session=False)
+            )
             if comment:
-                comment.like_count += 1
+                # 점수는 갱신 후 like_count로 계산 - 위 UPDATE가 행을 잠그므로 동시 좋아요의 증감이 모두 반영된 값
+                like_count = db.session.execute(
+                    select(Comment.like_count).where(Comment.id == comment_id)
+                ).scalar()
+                db.session.execute(
+                    update(Comment)
+                    .where(Comment.id == comment_id)
+                    .values(score=ranking.compute_score(like_count, comment.created_at))
+                    .execution_options(synchronize_session=False)
+                )
+                CommentService._record_like_event(comment, user_id, liked)
             db.session.commit()
-            return True
+        except IntegrityError:
+            # 같은 사용자의 동시 요청이 먼저 좋아요를 등록함
+            db.session.rollback()
+            return False
+        return True
     
     @staticmethod
     def get_comment_like_status(comment_id: int, user_id: str) -> bool:
@@ -0,0 +1,273 @@
+"""
+Comment Service 실시간 댓글 스트림 (Server-Sent Events)
+노드마다 하나의 허브(CommentStreamHub)가 백엔드에서 새 이벤트를 가져와
+구독 중인 연결들에 게시글 단위로 팬아웃합니다.
+
+- 기본 백엔드(OutboxStreamBackend)는 comment_outbox 테이블을 읽으므로 여러 노드에서 그대로 동작하며,
+  같은 프로세스에서 커밋된 변경은 즉시 깨워서 전달합니다.
+- 구독자마다 버퍼 크기가 제한되며, 넘치면 오래된 이벤트를 버리고 클라이언트에 reset을 보냅니다.
+- 구독자가 없으면 백엔드를 조회하지 않습니다.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from typing import List, Optional
+
+from flask import current_app
+from sqlalchemy import event as sa_event, func, select
+from sqlalchemy.orm import Session
+from werkzeug.utils import import_string
+
+from .models import db, OutboxEvent
+from . import outbox
+
+logger = logging.getLogger(__name__)
+
+STREAM_EVENT_TYPES = (
+    outbox.COMMENT_CREATED,
+    outbox.COMMENT_UPDATED,
+    outbox.COMMENT_DELETED,
+    outbox.COMMENT_STATUS_CHANGED,
+)
+
+# 커밋 시 깨울 허브 목록 (프로세스 내)
+_hubs = set()
+_hubs_lock = threading.Lock()
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _wake_hubs_after_commit(session):
+    """아웃박스 이벤트가 기록된 트랜잭션이 커밋되면 허브를 즉시 깨움"""
+    if session.info.pop("outbox_written", False):
+        with _hubs_lock:
+            hubs = list(_hubs)
+        for hub in hubs:
+            hub.wake()
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _clear_outbox_flag(session):
+    session.info.pop("outbox_written", None)
+
+
+def is_public_event(event: dict) -> bool:
+    """공개 스트림으로 보낼 수 있는 이벤트인지 - 숨김/삭제된 댓글의 수정 내용은 보내지 않음
+
+    status가 없는 이전 형식의 comment.updated 이벤트도 공개 여부를 알 수 없으므로 보내지 않습니다.
+    """
+    if event["event_type"] == outbox.COMMENT_UPDATED:
+        return event["payload"].get("status") == "visible"
+    return True
+
+
+def format_sse(event: dict) -> str:
+    """이벤트를 SSE 메시지 형식으로 변환"""
+    data = json.dumps(event["payload"], ensure_ascii=False)
+    return f"id: {event['id']}\nevent: {event['event_type']}\ndata: {data}\n\n"
+
+
+# ============================================================================
+# 백엔드
+# ============================================================================
+
+class StreamBackend:
+    """노드 간 이벤트 공급 인터페이스"""
+
+    def latest_id(self) -> int:
+        """현재 마지막 이벤트 id"""
+        raise NotImplementedError
+
+    def fetch(self, after_id: int, limit: int) -> List[dict]:
+        """after_id 이후 이벤트를 id 순서로 반환"""
+        raise NotImplementedError
+
+    def fetch_post(self, post_id: str, after_id: int, limit: int) -> List[dict]:
+        """특정 게시글의 after_id 이후 이벤트 (재연결 시 재전송용)"""
+        raise NotImplementedError
+
+
+class OutboxStreamBackend(StreamBackend):
+    """comment_outbox 테이블 기반 백엔드"""
+
+    def latest_id(self) -> int:
+        return db.session.execute(select(func.max(OutboxEvent.id))).scalar() or 0
+
+    def fetch(self, after_id: int, limit: int) -> List[dict]:
+        events = db.session.execute(
+            select(OutboxEvent)
+            .where(OutboxEvent.id > after_id, OutboxEvent.event_type.in_(STREAM_EVENT_TYPES))
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+        ).scalars().all()
+        return [event.to_dict() for event in events]
+
+    def fetch_post(self, post_id: str, after_id: int, limit: int) -> List[dict]:
+        events = db.session.execute(
+            select(OutboxEvent)
+            .where(
+                OutboxEvent.post_id == post_id,
+                OutboxEvent.id > after_id,
+                OutboxEvent.event_type.in_(STREAM_EVENT_TYPES)
+            )
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+        ).scalars().all()
+        return [event.to_dict() for event in events]
+
+
+# ============================================================================
+# 허브 / 구독
+# ============================================================================
+
+class Subscription:
+    """연결 하나의 제한된 이벤트 버퍼"""
+
+    def __init__(self, post_id: str, buffer_size: int):
+        self.post_id = post_id
+        self._events = deque(maxlen=buffer_size)
+        self._cond = threading.Condition()
+        self.overflowed = False
+
+    def push(self, event: dict) -> None:
+        with self._cond:
+            if len(self._events) == self._events.maxlen:
+                self.overflowed = True
+            self._events.append(event)
+            self._cond.notify()
+
+    def get(self, timeout: float) -> List[dict]:
+        """이벤트를 기다렸다가 모두 꺼냄 - 시간 초과 시 빈 목록"""
+        with self._cond:
+            if not self._events:
+                self._cond.wait(timeout)
+            events = list(self._events)
+            self._events.clear()
+            return events
+
+    def take_overflow(self) -> bool:
+        with self._cond:
+            overflowed, self.overflowed = self.overflowed, False
+            return overflowed
+
+
+class CommentStreamHub:
+    """백엔드에서 이벤트를 가져와 게시글별 구독자에게 팬아웃"""
+
+    # 동시 트랜잭션으로 id가 늦게 커밋되는 경우를 위해 다시 확인하는 범위
+    LOOKBACK = 100
+
+    def __init__(self, app, backend: StreamBackend, poll_interval: float = 1.0,
+                 buffer_size: int = 100, fetch_limit: int = 500):
+        self.app = app
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.buffer_size = buffer_size
+        self.fetch_limit = fetch_limit
+        self._subscribers = {}
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._last_id = None
+        self._seen = deque(maxlen=self.LOOKBACK * 10)
+        self._seen_ids = set()
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def subscribe(self, post_id: str) -> Subscription:
+        """구독 등록 (앱 컨텍스트 안에서 호출)"""
+        subscription = Subscription(post_id, self.buffer_size)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # 허브가 쉬고 있었다면 현재 위치부터 다시 시작
+                self._prime()
+                self._thread = threading.Thread(target=self._run, name="comment-stream-hub", daemon=True)
+                self._thread.start()
+            self._subscribers.setdefault(post_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.post_id)
+            if subscribers:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.post_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _mark_seen(self, event_id: int) -> bool:
+        """처음 보는 이벤트면 True"""
+        if event_id in self._seen_ids:
+            return False
+        if len(self._seen) == self._seen.maxlen:
+            self._seen_ids.discard(self._seen[0])
+        self._seen.append(event_id)
+        self._seen_ids.add(event_id)
+        return True
+
+    def _prime(self) -> None:
+        """현재 위치를 기준점으로 잡고 확인 범위 안의 기존 이벤트는 전달하지 않도록 표시"""
+        self._last_id = self.backend.latest_id()
+        for event in self.backend.fetch(max(self._last_id - self.LOOKBACK, 0), self.fetch_limit):
+            self._mark_seen(event["id"])
+
+    def poll_once(self) -> int:
+        """백엔드에서 새 이벤트를 가져와 팬아웃 (앱 컨텍스트 안에서 호출)"""
+        with self._lock:
+            if self._last_id is None:
+                self._prime()
+                return 0
+            events = self.backend.fetch(max(self._last_id - self.LOOKBACK, 0), self.fetch_limit)
+            return self._fan_out(events)
+
+    def _fan_out(self, events: List[dict]) -> int:
+        delivered = 0
+        for event in events:
+            self._last_id = max(self._last_id, event["id"])
+            if not self._mark_seen(event["id"]) or not is_public_event(event):
+                continue
+            for subscription in self._subscribers.get(event["post_id"], ()):
+                subscription.push(event)
+                delivered += 1
+        return delivered
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    # 구독자가 없으면 종료 - 다음 구독 시 최신 id부터 다시 시작
+                    self._thread = None
+                    self._last_id = None
+                    return
+            self._wake.clear()
+            try:
+                with self.app.app_context():
+                    self.poll_once()
+            except Exception as e:
+                logger.error(f"댓글 스트림 이벤트 조회 실패: {e}")
+            self._wake.wait(self.poll_interval)
+
+
+def init_stream(app) -> CommentStreamHub:
+    """앱에 댓글 스트림 허브 등록 - STREAM_BACKEND: 'outbox' 또는 'module:Class'"""
+    name = app.config.get("STREAM_BACKEND", "outbox")
+    backend = OutboxStreamBackend() if name == "outbox" else import_string(name)()
+    hub = CommentStreamHub(
+        app,
+        backend,
+        poll_interval=app.config.get("STREAM_POLL_INTERVAL", 1.0),
+        buffer_size=app.config.get("STREAM_SUBSCRIBER_BUFFER", 100)
+    )
+    app.extensions["comment_stream"] = hub
+    with _hubs_lock:
+        _hubs.add(hub)
+    return hub
+
+
+def get_hub() -> Optional[CommentStreamHub]:
+    return current_app.extensions.get("comment_stream")
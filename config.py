@@ -38,6 +38,13 @@ class Config:
     SQLALCHEMY_DATABASE_URI = get_database_uri()
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # async 조회 뷰 사용 여부 - Flask(WSGI)에서는 요청마다 이벤트 루프와 DB 연결을 새로 만들므로 기본은 동기 뷰
+    ASYNC_VIEWS_ENABLED = os.environ.get('ASYNC_VIEWS_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+    # async 조회 뷰용 비동기 DB URI - 비워두면 동기 URI의 드라이버만 aiosqlite/aiomysql로 바꿔 사용
+    ASYNC_DATABASE_URI = os.environ.get('ASYNC_DATABASE_URI')
+    # 비동기 엔진 커넥션 풀 크기 - 0이면 요청마다 연결(NullPool, Flask/WSGI용), ASGI 서버(asgi.py)에서는 풀 사용
+    ASYNC_DB_POOL_SIZE = int(os.environ.get('ASYNC_DB_POOL_SIZE', '0'))
+    
     # AWS Cognito 설정
     COGNITO_USER_POOL_ID = os.environ.get('COGNITO_USER_POOL_ID')
     COGNITO_REGION = os.environ.get('COGNITO_REGION', 'ap-northeast-2')
@@ -46,6 +53,44 @@ class Config:
     # JWT 설정
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=5)
     
+    # 관리자 API 접근을 허용할 Cognito 그룹
+    ADMIN_GROUP = os.environ.get('ADMIN_GROUP', 'admin')
+    
+    # Idempotency-Key 응답 보관 기간
+    IDEMPOTENCY_TTL_SECONDS = int(os.environ.get('IDEMPOTENCY_TTL_SECONDS', '86400'))
+    # 처리 중인 키의 임대 시간 - 이 시간 안에 끝나지 않은 요청(워커 종료 등)은 재시도가 넘겨받음
+    IDEMPOTENCY_LOCK_SECONDS = int(os.environ.get('IDEMPOTENCY_LOCK_SECONDS', '60'))
+    
+    # 아카이브 배치 설정
+    ARCHIVE_RETENTION_DAYS = int(os.environ.get('ARCHIVE_RETENTION_DAYS', '30'))
+    ARCHIVE_BATCH_SIZE = int(os.environ.get('ARCHIVE_BATCH_SIZE', '500'))
+    ARCHIVE_SLEEP_SECONDS = float(os.environ.get('ARCHIVE_SLEEP_SECONDS', '0.1'))
+    
+    # best 정렬 점수 감쇠 배치 설정 (이 기간 이내 작성된 댓글만 재계산)
+    RANKING_DECAY_DAYS = int(os.environ.get('RANKING_DECAY_DAYS', '7'))
+    
+    # 이벤트 아웃박스 설정 - OUTBOX_SINK: 'stdout', 'file', 'memory' 또는 'module:Class'
+    # 운영(ENVIRONMENT=production)에서는 컨테이너 안 파일 대신 표준출력(로그 수집기)으로 전달
+    OUTBOX_SINK = os.environ.get(
+        'OUTBOX_SINK', 'stdout' if os.environ.get('ENVIRONMENT') == 'production' else 'file'
+    )
+    OUTBOX_FILE_PATH = os.environ.get('OUTBOX_FILE_PATH', 'comment-events.ndjson')
+    OUTBOX_BATCH_SIZE = int(os.environ.get('OUTBOX_BATCH_SIZE', '500'))
+    OUTBOX_POLL_INTERVAL = float(os.environ.get('OUTBOX_POLL_INTERVAL', '1.0'))
+    OUTBOX_RETENTION_DAYS = int(os.environ.get('OUTBOX_RETENTION_DAYS', '7'))
+    # 전달 실패 시 게시글 단위 재시도 간격(초)과 dead letter 처리 전 최대 시도 횟수
+    OUTBOX_RETRY_SECONDS = float(os.environ.get('OUTBOX_RETRY_SECONDS', '30'))
+    OUTBOX_MAX_ATTEMPTS = int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '10'))
+    
+    # 실시간 댓글 스트림(SSE) 설정 - STREAM_BACKEND: 'outbox' 또는 'module:Class'
+    STREAM_BACKEND = os.environ.get('STREAM_BACKEND', 'outbox')
+    STREAM_POLL_INTERVAL = float(os.environ.get('STREAM_POLL_INTERVAL', '1.0'))
+    STREAM_SUBSCRIBER_BUFFER = int(os.environ.get('STREAM_SUBSCRIBER_BUFFER', '100'))
+    STREAM_HEARTBEAT_SECONDS = float(os.environ.get('STREAM_HEARTBEAT_SECONDS', '15'))
+    STREAM_MAX_SECONDS = float(os.environ.get('STREAM_MAX_SECONDS', '300'))
+    STREAM_REPLAY_LIMIT = int(os.environ.get('STREAM_REPLAY_LIMIT', '200'))
+    STREAM_RETRY_MS = int(os.environ.get('STREAM_RETRY_MS', '3000'))
+    
 
 class DevelopmentConfig(Config):
     """개발 환경 설정"""
@@ -61,6 +106,7 @@ class TestingConfig(Config):
     """테스트 환경 설정"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    OUTBOX_SINK = 'memory'
 
 config = {
     'development': DevelopmentConfig,